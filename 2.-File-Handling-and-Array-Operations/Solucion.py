@@ -1,13 +1,380 @@
 import os
+import io
+import time
+import hashlib
 import logging
+import sqlite3
+import contextlib
 import pandas as pd
 import pydicom
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Tuple
+from itertools import repeat
+from typing import Optional, List, Tuple, Dict, Union, Any
 from PIL import Image
 import json
 
+class _RunningStats:
+    """
+    Media y desviación estándar en una sola pasada, combinando bloques con la
+    fórmula de Chan et al. (generalización de Welford a bloques).
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self._mean = 0.0
+        self.m2 = 0.0
+    
+    def update(self, values: np.ndarray) -> None:
+        """Añade un bloque de valores (los NaN se ignoran, como en pandas)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        block_mean = values.mean()
+        deviations = values - block_mean
+        self._merge(values.size, block_mean, float(np.dot(deviations, deviations)))
+    
+    def _merge(self, count: int, mean: float, m2: float) -> None:
+        total = self.count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+    
+    def merge(self, other: '_RunningStats') -> None:
+        """Combina el acumulador de otra partición del archivo."""
+        if other.count:
+            self._merge(other.count, other._mean, other.m2)
+    
+    @property
+    def mean(self) -> float:
+        return float(self._mean) if self.count else float('nan')
+    
+    @property
+    def std(self) -> float:
+        """Desviación estándar muestral (ddof=1, igual que ``Series.std``)."""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float('nan')
+
+
+class _TopKCounter:
+    """
+    Frecuencias aproximadas con memoria acotada (space-saving).
+    
+    Guarda como máximo ``capacity`` contadores. Un valor nuevo que entra cuando
+    el resumen está lleno hereda el contador mínimo, que se anota como su error
+    máximo: ``count - error`` es una cota inferior de su frecuencia real (las
+    apariciones contadas desde que entró) y es lo que devuelve ``top``, de modo
+    que nunca se informa una frecuencia mayor que la real. Mientras no se
+    descarta ningún valor los conteos son exactos.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.exact = True
+    
+    @property
+    def min_count(self) -> int:
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
+    
+    def update(self, values: pd.Series) -> None:
+        """Añade los valores de un bloque (conteo vectorizado con ``value_counts``)."""
+        block_counts = values.value_counts()
+        if block_counts.empty:
+            return
+        base = self.min_count
+        # Orden de primera aparición, para desempatar igual que ``value_counts``
+        union = self.counts.index.append(block_counts.index.difference(self.counts.index, sort=False))
+        combined = (
+            self.counts.reindex(union, fill_value=base)
+            + block_counts.reindex(union, fill_value=0)
+        )
+        errors = self.errors.reindex(union, fill_value=base)
+        if len(combined) > self.capacity:
+            self.exact = False
+            combined = combined.nlargest(self.capacity)
+            errors = errors.reindex(combined.index)
+        self.counts = combined
+        self.errors = errors
+    
+    def top(self, n: int) -> pd.Series:
+        """Los ``n`` valores con mayor frecuencia garantizada (``count - error``)."""
+        guaranteed = self.counts - self.errors
+        return guaranteed.sort_values(ascending=False, kind='stable').head(n)
+
+
+class _DistinctCounter:
+    """
+    Número aproximado de valores distintos con HyperLogLog (2^precision registros).
+    """
+    
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+    
+    def update(self, values: pd.Series) -> None:
+        hashes = pd.util.hash_array(values.to_numpy()).astype(np.uint64)
+        if hashes.size == 0:
+            return
+        index = hashes >> np.uint64(64 - self.precision)
+        remaining = hashes << np.uint64(self.precision)
+        # Posición del primer bit a 1 en los 64 - precision bits restantes
+        high = (remaining >> np.uint64(32)).astype(np.float64)
+        low = (remaining & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        with np.errstate(divide='ignore'):
+            leading_zeros = np.where(
+                high > 0,
+                31 - np.floor(np.log2(high)),
+                32 + 31 - np.floor(np.log2(low))
+            )
+        max_rank = 64 - self.precision + 1
+        ranks = np.minimum(np.where(remaining == 0, max_rank, leading_zeros + 1), max_rank)
+        np.maximum.at(self.registers, index.astype(np.intp), ranks.astype(np.uint8))
+    
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Corrección para cardinalidades pequeñas (conteo lineal)
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+@dataclass
+class DicomFileResult:
+    """Resultado del procesamiento de un archivo DICOM dentro de un lote."""
+    
+    path: str
+    size_bytes: int = 0
+    patient_name: Optional[str] = None
+    study_date: Optional[str] = None
+    modality: Optional[str] = None
+    tags: Dict[Tuple[int, int], Optional[str]] = field(default_factory=dict)
+    image_path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class DicomBatchResult:
+    """Resultados de un lote de archivos DICOM y su rendimiento."""
+    
+    results: List[DicomFileResult]
+    seconds: float
+    workers: int
+    
+    @property
+    def files(self) -> int:
+        return len(self.results)
+    
+    @property
+    def total_bytes(self) -> int:
+        return sum(result.size_bytes for result in self.results)
+    
+    @property
+    def errors(self) -> List[DicomFileResult]:
+        return [result for result in self.results if not result.ok]
+    
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+    
+    @property
+    def mb_per_second(self) -> float:
+        return self.total_bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class DicomIndexStats:
+    """Resumen de una actualización del índice de metadatos DICOM."""
+    
+    scanned: int = 0
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+
+class DicomIndex:
+    """
+    Índice SQLite de metadatos DICOM para consultar tags sin volver a leer los archivos.
+    
+    Guarda por archivo su tamaño, fecha de modificación, SHA-256 y los tags
+    seleccionados (tabla clave-valor, con índice por tag y valor). Los valores
+    numéricos se guardan como números y el resto como texto, así que los rangos
+    de fechas DA (AAAAMMDD) se comparan correctamente.
+    """
+    
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self.connection = sqlite3.connect(index_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        with self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS settings (
+                    name TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    indexed_at TEXT NOT NULL,
+                    error TEXT
+                );
+                CREATE TABLE IF NOT EXISTS tags (
+                    path TEXT NOT NULL REFERENCES files (path) ON DELETE CASCADE,
+                    tag TEXT NOT NULL,
+                    value,
+                    PRIMARY KEY (path, tag)
+                );
+                CREATE INDEX IF NOT EXISTS tags_tag_value ON tags (tag, value);
+            """)
+    
+    def __enter__(self) -> 'DicomIndex':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        self.connection.close()
+    
+    @staticmethod
+    def tag_name(tag: pydicom.tag.BaseTag) -> str:
+        """Nombre con el que se guarda un tag: su keyword DICOM o GGGGEEEE si no tiene."""
+        return pydicom.datadict.keyword_for_tag(tag) or f"{tag:08X}"
+    
+    def indexed_tags(self) -> Optional[List[str]]:
+        row = self.connection.execute("SELECT value FROM settings WHERE name = 'tags'").fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def set_indexed_tags(self, tags: List[str]) -> None:
+        """Guarda la lista de tags indexados; el commit lo hace quien llama."""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO settings (name, value) VALUES ('tags', ?)", (json.dumps(tags),)
+        )
+    
+    def stored_files(self) -> Dict[str, Tuple[int, int]]:
+        """Tamaño y mtime (ns) guardados de cada archivo del índice."""
+        return {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self.connection.execute("SELECT path, size, mtime_ns FROM files")
+        }
+    
+    def upsert(self, path: str, size: int, mtime_ns: int, sha256: str,
+               tags: Dict[str, Any], error: Optional[str] = None) -> None:
+        """Guarda (o reemplaza) un archivo y sus tags; el commit lo hace quien llama."""
+        self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+        self.connection.execute(
+            "INSERT INTO files (path, size, mtime_ns, sha256, indexed_at, error) VALUES (?, ?, ?, ?, ?, ?)",
+            (path, size, mtime_ns, sha256, datetime.now().isoformat(timespec='seconds'), error)
+        )
+        self.connection.executemany(
+            "INSERT INTO tags (path, tag, value) VALUES (?, ?, ?)",
+            [(path, tag, value) for tag, value in tags.items()]
+        )
+    
+    def remove(self, paths: List[str]) -> None:
+        self.connection.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in paths])
+    
+    def query(self, criteria: Optional[Dict[str, Any]] = None, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Busca archivos por valor de tag sin abrir ningún DICOM.
+        
+        Cada criterio es ``tag=valor``; el valor puede ser un valor exacto, una
+        tupla ``(mínimo, máximo)`` (ambos incluidos, None deja el extremo abierto)
+        o una lista de valores aceptados. Los tags sin keyword se indican como
+        ``GGGGEEEE`` en ``criteria``.
+        
+        Ejemplo: ``index.query(Modality='CT', StudyDate=('20240101', '20241231'))``
+        
+        Returns:
+            Lista de diccionarios con ``path``, ``size``, ``sha256`` y los tags indexados, ordenada por ruta.
+        """
+        criteria = {**(criteria or {}), **kwargs}
+        
+        conditions = ["error IS NULL"]
+        params: List[Any] = []
+        for tag, value in criteria.items():
+            subquery = "path IN (SELECT path FROM tags WHERE tag = ? AND {})"
+            params.append(tag)
+            if isinstance(value, tuple):
+                low, high = value
+                clauses = []
+                if low is not None:
+                    clauses.append("value >= ?")
+                    params.append(low)
+                if high is not None:
+                    clauses.append("value <= ?")
+                    params.append(high)
+                conditions.append(subquery.format(" AND ".join(clauses) or "1"))
+            elif isinstance(value, list):
+                conditions.append(subquery.format(f"value IN ({', '.join('?' * len(value))})" if value else "0"))
+                params.extend(value)
+            else:
+                conditions.append(subquery.format("value = ?"))
+                params.append(value)
+        
+        rows = self.connection.execute(
+            f"SELECT path, size, sha256 FROM files WHERE {' AND '.join(conditions)} ORDER BY path", params
+        ).fetchall()
+        
+        # Los tags ausentes en un archivo aparecen como None
+        empty_tags = dict.fromkeys(self.indexed_tags() or [])
+        results = {
+            path: {'path': path, 'size': size, 'sha256': sha256, **empty_tags}
+            for path, size, sha256 in rows
+        }
+        if results:
+            # Los tags de los archivos encontrados se leen en bloques (límite de parámetros de SQLite)
+            paths = list(results)
+            for start in range(0, len(paths), 500):
+                block = paths[start:start + 500]
+                for path, tag, value in self.connection.execute(
+                    f"SELECT path, tag, value FROM tags WHERE path IN ({', '.join('?' * len(block))})", block
+                ):
+                    results[path][tag] = value
+        return list(results.values())
+
+
+class _ErrorCollector(logging.Handler):
+    """Guarda los mensajes de error registrados mientras está instalado en un logger."""
+    
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.messages: List[str] = []
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+# Procesador de cada proceso del pool de process_directory
+_worker_processor = None
+
+
+def _init_dicom_worker(base_path: str, log_file: str) -> None:
+    global _worker_processor
+    _worker_processor = FileProcessor(base_path, log_file)
+
+
+def _process_dicom_in_worker(filename: str, tags: Optional[List[Tuple[int, int]]], extract_image: bool) -> 'DicomFileResult':
+    return _worker_processor._process_dicom_for_batch(filename, tags, extract_image)
+
+
 class FileProcessor:
     """
     Clase para procesar archivos y datos con funcionalidades de manejo de CSV, DICOM y directorios.
@@ -16,6 +383,23 @@ class FileProcessor:
     # Constante para valores no disponibles
     NOT_AVAILABLE = 'No disponible'
     
+    # Contadores de frecuencia por columna no numérica en el análisis por bloques
+    TOP_K_CAPACITY = 1000
+    
+    # Tags que guarda index_directory si no se indican otros
+    DEFAULT_INDEX_TAGS = ('PatientID', 'PatientName', 'StudyDate', 'Modality',
+                          'StudyInstanceUID', 'SeriesInstanceUID', 'SOPInstanceUID')
+    
+    # Archivos indexados entre cada commit del índice
+    INDEX_COMMIT_EVERY = 500
+    
+    # Elementos que muestra _extract_basic_info; sin extracción de imagen solo se leen estos y los tags pedidos
+    BASIC_INFO_KEYWORDS = ('PatientName', 'StudyDate', 'Modality')
+    
+    # Los elementos mayores que esto (los datos de píxeles) no se leen al cargar el DICOM;
+    # los fotogramas se leen después uno a uno desde el archivo
+    DEFER_SIZE = '1 MB'
+    
     def __init__(self, base_path: str, log_file: str):
         """
         Inicializa la ruta base y configura el logging.
@@ -25,6 +409,7 @@ class FileProcessor:
             log_file (str): Archivo donde se escribirán los logs
         """
         self.base_path = base_path
+        self.log_file = log_file
         
         # Configurar logging
         logging.basicConfig(
@@ -132,7 +517,7 @@ class FileProcessor:
                     media = df[columna].mean()
                     desv_std = df[columna].std()
                     estadisticas[columna] = {'media': media, 'desviacion_estandar': desv_std}
-                    print(f"{columna}: Media = {media:.2f}, Desviación estándar = {desv_std:.2f}")
+                    self._print_column_statistics(columna, media, desv_std)
                 except Exception as e:
                     error_msg = f"Error al calcular estadísticas para columna '{columna}': {str(e)}"
                     self.logger.error(error_msg)
@@ -140,14 +525,18 @@ class FileProcessor:
         
         return estadisticas
     
-    def _save_report(self, filename: str, df: pd.DataFrame, estadisticas: dict, report_path: str) -> None:
+    def _print_column_statistics(self, columna: str, media: float, desv_std: float) -> None:
+        """Muestra la media y la desviación estándar de una columna."""
+        print(f"{columna}: Media = {media:.2f}, Desviación estándar = {desv_std:.2f}")
+    
+    def _save_report(self, filename: str, num_columnas: int, num_filas: int, estadisticas: dict, report_path: str) -> None:
         """Guarda el reporte de análisis."""
         try:
             with open(report_path, 'w', encoding='utf-8') as f:
                 f.write(f"Reporte de análisis CSV - {filename}\n")
                 f.write(f"Generado el: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(f"Número de columnas: {len(df.columns)}\n")
-                f.write(f"Número de filas: {len(df)}\n\n")
+                f.write(f"Número de columnas: {num_columnas}\n")
+                f.write(f"Número de filas: {num_filas}\n\n")
                 f.write("Estadísticas de columnas numéricas:\n")
                 for columna, stats in estadisticas.items():
                     f.write(f"{columna}: Media = {stats['media']:.2f}, Desviación estándar = {stats['desviacion_estandar']:.2f}\n")
@@ -164,15 +553,152 @@ class FileProcessor:
             print("\n=== Resumen de columnas no numéricas ===")
             for columna in columnas_no_numericas:
                 valores_unicos = df[columna].value_counts()
-                print(f"\nColumna '{columna}':")
-                print(f"Valores únicos: {len(valores_unicos)}")
-                print("Frecuencias:")
-                for valor, freq in valores_unicos.head(10).items():  # Mostrar top 10
-                    print(f"  {valor}: {freq}")
-                if len(valores_unicos) > 10:
-                    print(f"  ... y {len(valores_unicos) - 10} valores más")
-    
-    def read_csv(self, filename: str, report_path: Optional[str] = None, summary: bool = False) -> None:
+                self._print_frequencies(columna, len(valores_unicos), valores_unicos.head(10))
+    
+    def _print_frequencies(self, columna: str, num_unicos: int, frecuencias: pd.Series, aproximado: bool = False) -> None:
+        """Muestra el número de valores únicos y las frecuencias más altas de una columna."""
+        sufijo = " (aprox.)" if aproximado else ""
+        print(f"\nColumna '{columna}':")
+        print(f"Valores únicos: {num_unicos}{sufijo}")
+        print(f"Frecuencias{' (mínimo garantizado)' if aproximado else ''}:")
+        for valor, freq in frecuencias.items():  # Mostrar top 10
+            print(f"  {valor}: {freq}")
+        if num_unicos > 10:
+            print(f"  ... y {num_unicos - 10} valores más")
+    
+    @staticmethod
+    def _is_numeric_column(valores: pd.Series) -> bool:
+        """Mismo criterio que ``select_dtypes(include=[np.number])``."""
+        return pd.api.types.is_numeric_dtype(valores) and not pd.api.types.is_bool_dtype(valores)
+    
+    def _analyze_csv_in_chunks(self, filename: str, chunksize: int) -> Optional[dict]:
+        """
+        Recorre el CSV por bloques acumulando estadísticas con memoria acotada.
+        
+        El tipo de cada columna se decide con el primer bloque en el que tiene
+        valores (una columna vacía en todo el archivo es numérica, como en la
+        carga completa). Si un bloque posterior no coincide con ese tipo (texto
+        en una columna numérica o números en una de texto) la columna pasa a
+        ser no numérica y sus frecuencias se cuentan con una segunda pasada
+        solo sobre esas columnas, leídas como texto.
+        """
+        file_path = os.path.join(self.base_path, filename)
+        
+        if not os.path.exists(file_path):
+            error_msg = f"El archivo '{file_path}' no existe"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        
+        columnas = None
+        pendientes = []
+        num_filas = 0
+        numericas = {}
+        no_numericas = {}
+        # Si cada columna no numérica se clasificó con texto (False si eran booleanos)
+        de_texto = {}
+        reclasificadas = []
+        
+        try:
+            for chunk in pd.read_csv(file_path, chunksize=chunksize):
+                if columnas is None:
+                    columnas = list(chunk.columns)
+                    pendientes = list(columnas)
+                
+                # Un bloque sin valores en la columna no dice nada de su tipo
+                for columna in [columna for columna in pendientes if chunk[columna].notna().any()]:
+                    pendientes.remove(columna)
+                    if self._is_numeric_column(chunk[columna]):
+                        numericas[columna] = _RunningStats()
+                    else:
+                        no_numericas[columna] = (_TopKCounter(self.TOP_K_CAPACITY), _DistinctCounter())
+                        de_texto[columna] = pd.api.types.is_string_dtype(chunk[columna].dropna())
+                
+                num_filas += len(chunk)
+                for columna, acumulador in list(numericas.items()):
+                    valores = chunk[columna]
+                    if not self._is_numeric_column(valores) and valores.notna().any():
+                        self.logger.warning(
+                            f"La columna '{columna}' de '{filename}' contiene valores no numéricos; "
+                            f"se trata como no numérica"
+                        )
+                        del numericas[columna]
+                        reclasificadas.append(columna)
+                        continue
+                    acumulador.update(valores.to_numpy(dtype=np.float64, na_value=np.nan))
+                for columna, (frecuencias, distintos) in list(no_numericas.items()):
+                    valores = chunk[columna].dropna()
+                    if len(valores) and pd.api.types.is_string_dtype(valores) != de_texto[columna]:
+                        # Texto mezclado con números o booleanos: en la carga completa todo es texto
+                        del no_numericas[columna]
+                        reclasificadas.append(columna)
+                        continue
+                    frecuencias.update(valores)
+                    distintos.update(valores)
+            
+            if reclasificadas:
+                contadores = {
+                    columna: (_TopKCounter(self.TOP_K_CAPACITY), _DistinctCounter()) for columna in reclasificadas
+                }
+                for chunk in pd.read_csv(file_path, chunksize=chunksize, usecols=reclasificadas, dtype=str):
+                    for columna, (frecuencias, distintos) in contadores.items():
+                        valores = chunk[columna].dropna()
+                        frecuencias.update(valores)
+                        distintos.update(valores)
+                no_numericas.update(contadores)
+        except Exception as e:
+            error_msg = f"Error al leer el archivo CSV '{filename}': formato incorrecto - {str(e)}"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        
+        # Las columnas sin ningún valor son float64 (numéricas) en la carga completa
+        for columna in pendientes:
+            numericas[columna] = _RunningStats()
+        columnas = columnas or []
+        return {
+            'columnas': columnas,
+            'num_filas': num_filas,
+            'numericas': {columna: numericas[columna] for columna in columnas if columna in numericas},
+            'no_numericas': {columna: no_numericas[columna] for columna in columnas if columna in no_numericas},
+        }
+    
+    def _read_csv_in_chunks(self, filename: str, report_path: Optional[str], summary: bool, chunksize: int) -> None:
+        """Análisis de ``read_csv`` por bloques, con el mismo formato de salida."""
+        analisis = self._analyze_csv_in_chunks(filename, chunksize)
+        if analisis is None:
+            return
+        
+        columnas = analisis['columnas']
+        print(f"\n=== Análisis del archivo CSV: {filename} ===")
+        print(f"Número de columnas: {len(columnas)}")
+        print(f"Nombres de columnas: {columnas}")
+        print(f"Número de filas: {analisis['num_filas']}")
+        print()
+        
+        estadisticas = {}
+        if analisis['numericas']:
+            print("=== Estadísticas de columnas numéricas ===")
+            for columna, acumulador in analisis['numericas'].items():
+                estadisticas[columna] = {'media': acumulador.mean, 'desviacion_estandar': acumulador.std}
+                self._print_column_statistics(columna, acumulador.mean, acumulador.std)
+        
+        if report_path:
+            self._save_report(filename, len(columnas), analisis['num_filas'], estadisticas, report_path)
+        
+        if summary and analisis['no_numericas']:
+            print("\n=== Resumen de columnas no numéricas ===")
+            for columna, (frecuencias, distintos) in analisis['no_numericas'].items():
+                if frecuencias.exact:
+                    num_unicos = len(frecuencias.counts)
+                else:
+                    num_unicos = max(distintos.estimate(), len(frecuencias.counts))
+                self._print_frequencies(
+                    columna, num_unicos, frecuencias.top(10), aproximado=not frecuencias.exact
+                )
+    
+    def read_csv(self, filename: str, report_path: Optional[str] = None, summary: bool = False,
+                 chunksize: Optional[int] = None) -> None:
         """
         Lee y analiza un archivo CSV, mostrando estadísticas y generando reportes opcionales.
         
@@ -180,8 +706,16 @@ class FileProcessor:
             filename (str): Nombre del archivo CSV en base_path
             report_path (str, opcional): Ruta donde guardar el reporte de análisis
             summary (bool): Si es True, muestra resumen de columnas no numéricas
+            chunksize (int, opcional): Si se indica, lee el archivo por bloques de ese número
+                de filas con memoria acotada (media y desviación en una pasada, frecuencias
+                aproximadas si una columna supera TOP_K_CAPACITY valores distintos)
         """
         try:
+            if chunksize:
+                self._read_csv_in_chunks(filename, report_path, summary, chunksize)
+                self.logger.info(f"Análisis por bloques exitoso del archivo CSV '{filename}'")
+                return
+            
             df = self._load_csv_file(filename)
             if df is None:
                 return
@@ -195,7 +729,7 @@ class FileProcessor:
             estadisticas = self._calculate_numeric_statistics(df)
             
             if report_path:
-                self._save_report(filename, df, estadisticas, report_path)
+                self._save_report(filename, len(df.columns), len(df), estadisticas, report_path)
             
             if summary:
                 self._show_non_numeric_summary(df)
@@ -207,8 +741,29 @@ class FileProcessor:
             self.logger.error(error_msg)
             print(f"Error: {error_msg}")
     
-    def _load_dicom_file(self, filename: str):
-        """Carga y valida un archivo DICOM."""
+    def _dicom_read_options(self, tags: Optional[List[Tuple[int, int]]], metadata_only: bool) -> dict:
+        """
+        Argumentos de pydicom.dcmread según lo que se va a usar del archivo.
+        
+        En modo solo metadatos la lectura se detiene antes de los píxeles y los
+        demás elementos se saltan sin leer su valor; los tags mal formados se
+        omiten aquí y se informan al procesarlos. En modo completo los datos de
+        píxeles se difieren para no cargar el volumen entero en memoria.
+        """
+        if not metadata_only:
+            return {'defer_size': self.DEFER_SIZE}
+        
+        specific_tags = list(self.BASIC_INFO_KEYWORDS)
+        for tag in tags or []:
+            try:
+                specific_tags.append(pydicom.tag.Tag(tag[0], tag[1]))
+            except Exception:
+                continue
+        return {'stop_before_pixels': True, 'specific_tags': specific_tags}
+    
+    def _load_dicom_file(self, filename: str, tags: Optional[List[Tuple[int, int]]] = None,
+                         metadata_only: bool = False):
+        """Carga y valida un archivo DICOM; con metadata_only no lee los datos de píxeles."""
         file_path = os.path.join(self.base_path, filename)
         
         if not os.path.exists(file_path):
@@ -218,7 +773,7 @@ class FileProcessor:
             return None
             
         try:
-            return pydicom.dcmread(file_path)
+            return pydicom.dcmread(file_path, **self._dicom_read_options(tags, metadata_only))
         except Exception as e:
             error_msg = f"Error al leer el archivo DICOM '{filename}': formato inválido - {str(e)}"
             self.logger.error(error_msg)
@@ -287,14 +842,14 @@ class FileProcessor:
                 return pixel_array.astype(np.uint8)
         return pixel_array
     
-    def _save_image_as_png(self, pixel_array: np.ndarray, filename: str) -> bool:
-        """Guarda el array de píxeles como imagen PNG."""
+    def _save_image_as_png(self, pixel_array: np.ndarray, filename: str) -> Optional[str]:
+        """Guarda el array de píxeles como imagen PNG y devuelve su ruta."""
         try:
             image = Image.fromarray(pixel_array)
             
             imagenes_folder = os.path.join(self.base_path, "imagenes_extraidas")
             if not os.path.exists(imagenes_folder):
-                os.makedirs(imagenes_folder)
+                os.makedirs(imagenes_folder, exist_ok=True)
                 print(f"Carpeta creada: {imagenes_folder}")
             
             base_name = os.path.splitext(os.path.basename(filename))[0]
@@ -304,80 +859,181 @@ class FileProcessor:
             image.save(png_path)
             print(f"\nImagen extraída y guardada como: {os.path.join('imagenes_extraidas', png_filename)}")
             self.logger.info(f"Imagen DICOM extraída exitosamente: {png_path}")
-            return True
+            return png_path
             
         except Exception as e:
             error_msg = f"Error al crear imagen PIL: {str(e)}"
             self.logger.error(error_msg)
             print(f"Error: {error_msg}")
-            return False
+            return None
     
-    def _save_as_numpy_fallback(self, pixel_array: np.ndarray, filename: str) -> None:
-        """Guarda como archivo numpy si falla PNG."""
+    def _save_as_numpy_fallback(self, pixel_array: np.ndarray, filename: str) -> Optional[str]:
+        """Guarda como archivo numpy si falla PNG y devuelve su ruta."""
         try:
             imagenes_folder = os.path.join(self.base_path, "imagenes_extraidas")
             if not os.path.exists(imagenes_folder):
-                os.makedirs(imagenes_folder)
+                os.makedirs(imagenes_folder, exist_ok=True)
             
             npy_filename = f"{os.path.splitext(os.path.basename(filename))[0]}_datos.npy"
             npy_path = os.path.join(imagenes_folder, npy_filename)
             np.save(npy_path, pixel_array)
             print(f"Datos guardados como numpy array en: {os.path.join('imagenes_extraidas', npy_filename)}")
             self.logger.info(f"Datos del DICOM guardados como numpy array: {npy_path}")
+            return npy_path
         except Exception as e:
             error_msg = f"Error al guardar datos numpy: {str(e)}"
             self.logger.error(error_msg)
             print(f"Error: {error_msg}")
+            return None
     
-    def _extract_and_save_image(self, dicom_data, filename: str) -> None:
-        """Extrae y guarda la imagen del DICOM."""
-        if not hasattr(dicom_data, 'pixel_array'):
-            error_msg = f"El archivo DICOM '{filename}' no contiene datos de píxeles"
-            self.logger.error(error_msg)
-            print(f"Error: {error_msg}")
-            return
-        
-        pixel_array = dicom_data.pixel_array
-        
-        print("Información del array de píxeles:")
-        print(f"  Forma: {pixel_array.shape}")
-        print(f"  Tipo de datos: {pixel_array.dtype}")
-        print(f"  Rango de valores: {np.min(pixel_array)} - {np.max(pixel_array)}")
-        
+    @staticmethod
+    def _has_pixel_data(dicom_data) -> bool:
+        return any(keyword in dicom_data for keyword in ('PixelData', 'FloatPixelData', 'DoubleFloatPixelData'))
+    
+    @staticmethod
+    def _number_of_frames(dicom_data) -> int:
+        return int(getattr(dicom_data, 'NumberOfFrames', 1) or 1)
+    
+    @staticmethod
+    def _pixel_source(dicom_data):
+        """
+        Origen desde el que pydicom lee los fotogramas: el archivo si existe, para
+        leer solo los bytes de cada fotograma (también en sintaxis comprimidas),
+        o el propio dataset si no se cargó desde disco.
+        """
+        source = getattr(dicom_data, 'filename', None)
+        if isinstance(source, str) and os.path.exists(source):
+            return source
+        return dicom_data
+    
+    def _prepare_image(self, pixel_array: np.ndarray) -> Optional[np.ndarray]:
+        """Convierte un fotograma en una imagen 2D normalizada o devuelve None si no es posible."""
         pixel_array = self._reshape_pixel_array(pixel_array)
         if pixel_array is None:
-            return
+            return None
         
         if len(pixel_array.shape) != 2:
             error_msg = f"El array de píxeles tiene forma {pixel_array.shape}, no se puede convertir a imagen 2D"
             self.logger.error(error_msg)
             print(f"Error: {error_msg}")
-            return
+            return None
         
         if pixel_array.shape[0] == 0 or pixel_array.shape[1] == 0:
             error_msg = f"El array de píxeles tiene dimensiones inválidas: {pixel_array.shape}"
             self.logger.error(error_msg)
             print(f"Error: {error_msg}")
-            return
+            return None
+        
+        return self._normalize_pixel_array(pixel_array)
+    
+    def _extract_and_save_image(self, dicom_data, filename: str, frame: Optional[int] = None) -> Optional[str]:
+        """
+        Extrae y guarda un fotograma del DICOM; devuelve la ruta guardada o None si falla.
+        
+        Solo se lee y decodifica el fotograma elegido (por defecto, el central),
+        no el volumen completo.
+        """
+        if not self._has_pixel_data(dicom_data):
+            error_msg = f"El archivo DICOM '{filename}' no contiene datos de píxeles"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        
+        num_frames = self._number_of_frames(dicom_data)
+        if frame is None:
+            frame = num_frames // 2
+        if not 0 <= frame < num_frames:
+            error_msg = f"El fotograma {frame} no existe: el archivo '{filename}' tiene {num_frames}"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        
+        pixel_array = pydicom.pixels.pixel_array(self._pixel_source(dicom_data), index=frame)
+        
+        print("Información del array de píxeles:")
+        if num_frames > 1:
+            print(f"  Fotogramas: {num_frames} (seleccionado: {frame})")
+        print(f"  Forma: {pixel_array.shape}")
+        print(f"  Tipo de datos: {pixel_array.dtype}")
+        print(f"  Rango de valores: {np.min(pixel_array)} - {np.max(pixel_array)}")
+        
+        pixel_array = self._prepare_image(pixel_array)
+        if pixel_array is None:
+            return None
         
         print(f"  Forma final para imagen: {pixel_array.shape}")
         
-        pixel_array = self._normalize_pixel_array(pixel_array)
+        return self._save_image_as_png(pixel_array, filename) or self._save_as_numpy_fallback(pixel_array, filename)
+    
+    def export_frames(self, filename: str, frames: Optional[List[int]] = None) -> Optional[List[str]]:
+        """
+        Exporta fotogramas de un DICOM multiframe como PNG, uno a uno.
+        
+        Cada fotograma se lee, normaliza y guarda antes de leer el siguiente, así
+        que la memoria usada es la de un fotograma aunque el volumen ocupe GB.
+        
+        Args:
+            filename (str): Nombre del archivo DICOM en base_path
+            frames (List[int], opcional): Índices de los fotogramas (desde 0); por defecto, todos
         
-        if not self._save_image_as_png(pixel_array, filename):
-            self._save_as_numpy_fallback(pixel_array, filename)
+        Returns:
+            Rutas de las imágenes guardadas o None si el archivo no se puede leer.
+        """
+        try:
+            dicom_data = self._load_dicom_file(filename)
+            if dicom_data is None:
+                return None
+            
+            if not self._has_pixel_data(dicom_data):
+                error_msg = f"El archivo DICOM '{filename}' no contiene datos de píxeles"
+                self.logger.error(error_msg)
+                print(f"Error: {error_msg}")
+                return None
+            
+            num_frames = self._number_of_frames(dicom_data)
+            frames = list(range(num_frames)) if frames is None else list(frames)
+            invalid = [index for index in frames if not 0 <= index < num_frames]
+            if invalid:
+                error_msg = f"Fotogramas inexistentes en '{filename}' (tiene {num_frames}): {invalid}"
+                self.logger.error(error_msg)
+                print(f"Error: {error_msg}")
+                return None
+            
+            base_name = os.path.splitext(os.path.basename(filename))[0]
+            paths = []
+            pixel_frames = pydicom.pixels.iter_pixels(self._pixel_source(dicom_data), indices=frames)
+            for index, pixel_array in zip(frames, pixel_frames):
+                pixel_array = self._prepare_image(pixel_array)
+                if pixel_array is None:
+                    continue
+                frame_name = f"{base_name}_fotograma_{index:04d}"
+                path = self._save_image_as_png(pixel_array, frame_name) or self._save_as_numpy_fallback(pixel_array, frame_name)
+                if path:
+                    paths.append(path)
+            
+            self.logger.info(f"Exportados {len(paths)} de {len(frames)} fotogramas del DICOM '{filename}'")
+            return paths
+            
+        except Exception as e:
+            error_msg = f"Error al exportar fotogramas del DICOM '{filename}': {str(e)}"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
     
-    def read_dicom(self, filename: str, tags: Optional[List[Tuple[int, int]]] = None, extract_image: bool = False) -> None:
+    def read_dicom(self, filename: str, tags: Optional[List[Tuple[int, int]]] = None, extract_image: bool = False,
+                   frame: Optional[int] = None) -> None:
         """
         Lee un archivo DICOM y extrae información médica y opcionalmente imágenes.
         
         Args:
             filename (str): Nombre del archivo DICOM en base_path
             tags (List[Tuple[int, int]], opcional): Lista de tags DICOM a extraer
-            extract_image (bool): Si es True, extrae la imagen como PNG
+            extract_image (bool): Si es True, extrae la imagen como PNG; si es False
+                solo se leen la cabecera y los tags necesarios, sin los datos de píxeles
+            frame (int, opcional): Fotograma a extraer (desde 0) en archivos multiframe; por defecto, el central
         """
         try:
-            dicom_data = self._load_dicom_file(filename)
+            dicom_data = self._load_dicom_file(filename, tags, metadata_only=not extract_image)
             if dicom_data is None:
                 return
             
@@ -390,7 +1046,7 @@ class FileProcessor:
             
             if extract_image:
                 try:
-                    self._extract_and_save_image(dicom_data, filename)
+                    self._extract_and_save_image(dicom_data, filename, frame)
                 except Exception as e:
                     error_msg = f"Error al extraer imagen del DICOM '{filename}': {str(e)}"
                     self.logger.error(error_msg)
@@ -402,6 +1058,248 @@ class FileProcessor:
             error_msg = f"Error inesperado al procesar DICOM '{filename}': {str(e)}"
             self.logger.error(error_msg)
             print(f"Error: {error_msg}")
+    
+    def _find_files(self, folder_name: str, extensions: Optional[Tuple[str, ...]]) -> List[str]:
+        """Recorre la carpeta recursivamente y devuelve las rutas relativas a base_path en orden."""
+        folder_path = os.path.join(self.base_path, folder_name)
+        files = []
+        for root, dirnames, filenames in os.walk(folder_path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if extensions is None or name.lower().endswith(extensions):
+                    files.append(os.path.relpath(os.path.join(root, name), self.base_path))
+        return files
+    
+    def _process_dicom_for_batch(self, filename: str, tags: Optional[List[Tuple[int, int]]],
+                                 extract_image: bool) -> DicomFileResult:
+        """Procesa un archivo del lote sin imprimir nada; los errores quedan en el resultado."""
+        start = time.perf_counter()
+        result = DicomFileResult(path=filename)
+        try:
+            file_path = os.path.join(self.base_path, filename)
+            result.size_bytes = os.path.getsize(file_path)
+            dicom_data = pydicom.dcmread(file_path, **self._dicom_read_options(tags, metadata_only=not extract_image))
+            
+            for attribute, keyword in (('patient_name', 'PatientName'), ('study_date', 'StudyDate'), ('modality', 'Modality')):
+                if keyword in dicom_data:
+                    setattr(result, attribute, str(dicom_data.data_element(keyword).value))
+            
+            for tag in tags or []:
+                tag_hex = (tag[0], tag[1])
+                result.tags[tag_hex] = str(dicom_data[tag_hex].value) if tag_hex in dicom_data else None
+            
+            if extract_image:
+                # Las rutas relativas se aplanan para que archivos con el mismo nombre
+                # en distintas series no se sobrescriban en imagenes_extraidas
+                output_name = filename.replace(os.sep, '__')
+                collector = _ErrorCollector()
+                self.logger.addHandler(collector)
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        result.image_path = self._extract_and_save_image(dicom_data, output_name)
+                finally:
+                    self.logger.removeHandler(collector)
+                if result.image_path is None:
+                    result.error = collector.messages[0] if collector.messages else f"No se pudo extraer la imagen de '{filename}'"
+        except Exception as e:
+            result.error = f"Error al procesar DICOM '{filename}': {str(e)}"
+            self.logger.error(result.error)
+        
+        result.seconds = time.perf_counter() - start
+        return result
+    
+    def process_directory(self, folder_name: str, tags: Optional[List[Tuple[int, int]]] = None,
+                          extract_image: bool = False, workers: Optional[int] = None,
+                          extensions: Optional[Tuple[str, ...]] = ('.dcm',)) -> Optional[DicomBatchResult]:
+        """
+        Procesa en paralelo todos los archivos DICOM de una carpeta y sus subcarpetas.
+        
+        Args:
+            folder_name (str): Carpeta relativa a base_path (p. ej. un estudio)
+            tags (List[Tuple[int, int]], opcional): Lista de tags DICOM a extraer de cada archivo
+            extract_image (bool): Si es True, extrae la imagen de cada archivo como PNG
+            workers (int, opcional): Procesos del pool (por defecto, uno por CPU; 1 procesa en el propio proceso)
+            extensions (Tuple[str, ...], opcional): Extensiones a incluir; None incluye todos los archivos
+        
+        Returns:
+            DicomBatchResult con un resultado por archivo (en orden de recorrido) o None si la carpeta no existe.
+            Un archivo con error no interrumpe el lote: su mensaje queda en ``error``.
+        """
+        folder_path = os.path.join(self.base_path, folder_name)
+        if not os.path.isdir(folder_path):
+            error_msg = f"La carpeta '{folder_path}' no existe"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        
+        files = self._find_files(folder_name, extensions)
+        workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+        
+        start = time.perf_counter()
+        if workers == 1:
+            results = [self._process_dicom_for_batch(filename, tags, extract_image) for filename in files]
+        else:
+            # Bloques de varios archivos por tarea: los cortes son pequeños y el coste
+            # de enviar cada tarea al pool sería comparable al de procesarla
+            chunksize = max(1, len(files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_dicom_worker,
+                                     initargs=(self.base_path, self.log_file)) as pool:
+                results = list(pool.map(_process_dicom_in_worker, files, repeat(tags), repeat(extract_image),
+                                        chunksize=chunksize))
+        batch = DicomBatchResult(results=results, seconds=time.perf_counter() - start, workers=workers)
+        
+        self.logger.info(
+            f"Lote DICOM '{folder_name}': {batch.files} archivos ({len(batch.errors)} con error) "
+            f"en {batch.seconds:.2f} s con {workers} procesos, "
+            f"{batch.files_per_second:.1f} archivos/s, {batch.mb_per_second:.1f} MB/s"
+        )
+        return batch
+    
+    @staticmethod
+    def _index_value(value: Any) -> Any:
+        """Convierte el valor de un elemento DICOM a un tipo que SQLite compara correctamente."""
+        if isinstance(value, bool) or value is None:
+            return value
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, float):
+            return float(value)
+        if isinstance(value, pydicom.multival.MultiValue):
+            # Mismo separador que usa DICOM para valores múltiples
+            return '\\'.join(str(item) for item in value)
+        return str(value)
+    
+    @staticmethod
+    def _file_sha256(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def index_directory(self, folder_name: str, index_path: str,
+                        tags: Optional[List[Union[str, Tuple[int, int]]]] = None,
+                        extensions: Optional[Tuple[str, ...]] = ('.dcm',)) -> Optional[DicomIndexStats]:
+        """
+        Crea o actualiza un índice SQLite con los metadatos de los DICOM de una carpeta.
+        
+        La actualización es incremental: solo se vuelven a leer los archivos
+        nuevos o cuyo tamaño o fecha de modificación cambió, y se eliminan del
+        índice los que ya no existen. Si cambia la lista de tags se reindexa todo.
+        Los archivos que no se pueden leer quedan registrados con su error y no
+        se reintentan hasta que cambien.
+        
+        Args:
+            folder_name (str): Carpeta relativa a base_path
+            index_path (str): Archivo SQLite del índice
+            tags (List, opcional): Keywords DICOM o tuplas (grupo, elemento) a guardar
+                (por defecto, DEFAULT_INDEX_TAGS)
+            extensions (Tuple[str, ...], opcional): Extensiones a incluir; None incluye todos los archivos
+        
+        Returns:
+            DicomIndexStats con el resumen de la actualización o None si hay un error.
+        """
+        folder_path = os.path.join(self.base_path, folder_name)
+        if not os.path.isdir(folder_path):
+            error_msg = f"La carpeta '{folder_path}' no existe"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        
+        try:
+            dicom_tags = [
+                pydicom.tag.Tag(tag) if isinstance(tag, str) else pydicom.tag.Tag(tag[0], tag[1])
+                for tag in (tags or self.DEFAULT_INDEX_TAGS)
+            ]
+        except Exception as e:
+            error_msg = f"Lista de tags inválida para el índice: {str(e)}"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        tag_names = [DicomIndex.tag_name(tag) for tag in dicom_tags]
+        
+        start = time.perf_counter()
+        stats = DicomIndexStats()
+        try:
+            with DicomIndex(index_path) as index:
+                reindex_all = index.indexed_tags() != tag_names
+                stored = index.stored_files()
+                files = self._find_files(folder_name, extensions)
+                
+                for filename in files:
+                    stats.scanned += 1
+                    file_path = os.path.join(self.base_path, filename)
+                    file_stat = os.stat(file_path)
+                    previous = stored.get(filename)
+                    if not reindex_all and previous == (file_stat.st_size, file_stat.st_mtime_ns):
+                        stats.unchanged += 1
+                        continue
+                    
+                    values, sha256, error = {}, '', None
+                    try:
+                        sha256 = self._file_sha256(file_path)
+                        dicom_data = pydicom.dcmread(file_path, stop_before_pixels=True, specific_tags=dicom_tags)
+                        for name, tag in zip(tag_names, dicom_tags):
+                            if tag in dicom_data:
+                                values[name] = self._index_value(dicom_data[tag].value)
+                    except Exception as e:
+                        error = f"Error al indexar DICOM '{filename}': {str(e)}"
+                        self.logger.error(error)
+                        stats.errors += 1
+                    
+                    index.upsert(filename, file_stat.st_size, file_stat.st_mtime_ns, sha256, values, error)
+                    if previous is None:
+                        stats.added += 1
+                    else:
+                        stats.updated += 1
+                    # Commits periódicos: si se interrumpe, lo indexado no se vuelve a leer
+                    if (stats.added + stats.updated) % self.INDEX_COMMIT_EVERY == 0:
+                        index.connection.commit()
+                
+                folder = os.path.normpath(folder_name)
+                seen = set(files)
+                removed = [
+                    path for path in stored
+                    if path not in seen and (folder == '.' or path.startswith(folder + os.sep))
+                ]
+                index.remove(removed)
+                stats.removed = len(removed)
+                
+                index.set_indexed_tags(tag_names)
+                index.connection.commit()
+        except Exception as e:
+            error_msg = f"Error al actualizar el índice '{index_path}': {str(e)}"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        
+        stats.seconds = time.perf_counter() - start
+        self.logger.info(
+            f"Índice '{index_path}' actualizado para '{folder_name}': {stats.scanned} archivos, "
+            f"{stats.added} nuevos, {stats.updated} actualizados, {stats.unchanged} sin cambios, "
+            f"{stats.removed} eliminados, {stats.errors} con error en {stats.seconds:.2f} s"
+        )
+        return stats
+    
+    def query_index(self, index_path: str, criteria: Optional[Dict[str, Any]] = None,
+                    **kwargs: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Consulta un índice creado con index_directory sin leer los archivos DICOM.
+        
+        Los criterios son los de DicomIndex.query, p. ej.
+        ``processor.query_index("indice.sqlite", Modality='CT', StudyDate=('20240101', '20241231'))``.
+        
+        Returns:
+            Lista de archivos que cumplen los criterios o None si el índice no existe.
+        """
+        if not os.path.exists(index_path):
+            error_msg = f"El índice '{index_path}' no existe"
+            self.logger.error(error_msg)
+            print(f"Error: {error_msg}")
+            return None
+        
+        with DicomIndex(index_path) as index:
+            return index.query(criteria, **kwargs)
 
 
 # Ejemplo de uso:
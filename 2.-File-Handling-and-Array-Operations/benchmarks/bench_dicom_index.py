@@ -0,0 +1,75 @@
+"""
+Benchmark del índice de metadatos DICOM (index_directory / query_index).
+
+Sobre los DICOM de ``samples/`` copiados N veces mide la indexación inicial,
+una reindexación sin cambios, una reindexación con un 1 % de archivos
+modificados y una consulta por tags, comparada con releer todos los archivos.
+
+Uso:
+    python benchmarks/bench_dicom_index.py [--copies 500]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pydicom
+
+from bench_process_directory import PROJECT_DIR, build_study
+
+sys.path.insert(0, PROJECT_DIR)
+from Solucion import FileProcessor  # noqa: E402
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def scan_files(folder):
+    """Consulta equivalente sin índice: leer las cabeceras de todos los archivos"""
+    matches = []
+    for root, _, filenames in os.walk(folder):
+        for name in filenames:
+            dicom_data = pydicom.dcmread(os.path.join(root, name), stop_before_pixels=True,
+                                         specific_tags=['Modality', 'StudyDate'])
+            if dicom_data.Modality == 'XA' and '19900101' <= dicom_data.StudyDate <= '20000101':
+                matches.append(name)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--copies', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = build_study(os.path.join(tmp, 'estudio'), args.copies)
+        processor = FileProcessor(tmp, os.path.join(tmp, 'bench.log'))
+        index_path = os.path.join(tmp, 'indice.sqlite')
+        print(f"Archivos: {files}")
+
+        _, seconds = timed(lambda: processor.index_directory('estudio', index_path))
+        print(f"{'indexación inicial':>28}: {seconds:8.3f} s")
+        _, seconds = timed(lambda: processor.index_directory('estudio', index_path))
+        print(f"{'reindexación sin cambios':>28}: {seconds:8.3f} s")
+
+        for root, _, filenames in os.walk(os.path.join(tmp, 'estudio')):
+            for name in filenames[::100]:
+                os.utime(os.path.join(root, name))
+        stats, seconds = timed(lambda: processor.index_directory('estudio', index_path))
+        print(f"{f'reindexación ({stats.updated} cambiados)':>28}: {seconds:8.3f} s")
+
+        found, query_seconds = timed(lambda: processor.query_index(
+            index_path, Modality='XA', StudyDate=('19900101', '20000101')
+        ))
+        scanned, scan_seconds = timed(lambda: scan_files(os.path.join(tmp, 'estudio')))
+        assert len(found) == len(scanned)
+        print(f"{'consulta con índice':>28}: {query_seconds:8.3f} s ({len(found)} archivos)")
+        print(f"{'consulta leyendo archivos':>28}: {scan_seconds:8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark de la lectura DICOM solo de metadatos frente a la lectura completa.
+
+Lee cada archivo con ``pydicom.dcmread`` sin opciones (lectura completa) y
+con las opciones de solo metadatos de FileProcessor
+(``stop_before_pixels``/``specific_tags``) a través de un archivo sin búfer
+que cuenta los bytes leídos, y mide el tiempo de cada modo.
+
+Uso:
+    python benchmarks/bench_dicom_metadata.py [--repeat 20] [archivo.dcm ...]
+"""
+import argparse
+import glob
+import io
+import os
+import sys
+import tempfile
+import time
+
+import pydicom
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+from Solucion import FileProcessor  # noqa: E402
+
+
+class CountingFile(io.FileIO):
+    """Archivo sin búfer que acumula los bytes leídos del disco"""
+
+    def __init__(self, path):
+        super().__init__(path, 'rb')
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data or b'')
+        return data
+
+    def readinto(self, buffer):
+        n = super().readinto(buffer)
+        self.bytes_read += n or 0
+        return n
+
+
+def measure(path, options, repeat):
+    with CountingFile(path) as counting:
+        pydicom.dcmread(counting, **options)
+        bytes_read = counting.bytes_read
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pydicom.dcmread(path, **options)
+        times.append(time.perf_counter() - start)
+    return bytes_read, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('files', nargs='*', default=sorted(glob.glob(os.path.join(PROJECT_DIR, 'samples', '*.dcm'))))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        processor = FileProcessor(tmp, os.path.join(tmp, 'bench.log'))
+        tags = [(0x0028, 0x0010), (0x0028, 0x0011)]
+        modes = (
+            ('completo', {}),
+            ('metadatos', processor._dicom_read_options(tags, metadata_only=True)),
+        )
+
+        print(f"{'archivo':>14} {'modo':>10} {'bytes leídos':>14} {'tiempo (ms)':>12}")
+        for path in args.files:
+            results = {}
+            for label, options in modes:
+                results[label] = measure(path, options, args.repeat)
+                bytes_read, seconds = results[label]
+                print(f"{os.path.basename(path):>14} {label:>10} {bytes_read:>14,} {seconds * 1000:>12.2f}")
+            saved = results['completo'][0] - results['metadatos'][0]
+            print(f"{'':>14} {'ahorro':>10} {saved:>14,} "
+                  f"{results['completo'][1] / results['metadatos'][1]:>11.1f}x")
+
+
+if __name__ == '__main__':
+    main()
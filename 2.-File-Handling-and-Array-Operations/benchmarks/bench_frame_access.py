@@ -0,0 +1,83 @@
+"""
+Benchmark del acceso por fotograma a DICOM multiframe sin comprimir.
+
+Genera un volumen sintético (Explicit VR Little Endian) a partir de
+``samples/prueba.dcm`` y ejecuta cada modo en un proceso aparte para medir el
+tiempo y el pico de memoria (RSS):
+
+- ``volumen completo``: decodificar ``pixel_array`` entero y quedarse con el fotograma central
+- ``read_dicom``: extracción de imagen de FileProcessor (solo el fotograma central)
+- ``export_frames``: exportación de todos los fotogramas, uno a uno
+
+Uso:
+    python benchmarks/bench_frame_access.py [--frames 400]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import contextlib, io, resource, sys, time
+sys.path.insert(0, {project!r})
+import pydicom
+from Solucion import FileProcessor
+processor = FileProcessor({base!r}, {log!r})
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    {statement}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+MODES = (
+    ('volumen completo', "pixels = pydicom.dcmread('volumen.dcm').pixel_array; frame = pixels[len(pixels) // 2]"),
+    ('read_dicom', "processor.read_dicom('volumen.dcm', extract_image=True)"),
+    ('export_frames', "processor.export_frames('volumen.dcm')"),
+)
+
+
+# El volumen se genera en otro proceso: el pico de memoria de los hijos no debe
+# incluir el del proceso que lo escribió
+WRITE_VOLUME = """
+import numpy as np, pydicom
+dicom_data = pydicom.dcmread({sample!r})
+volume = np.random.default_rng(0).integers(0, 4096, ({frames}, dicom_data.Rows, dicom_data.Columns), dtype=np.uint16)
+dicom_data.NumberOfFrames = {frames}
+dicom_data.PixelData = volume.tobytes()
+dicom_data.save_as({path!r})
+"""
+
+
+def write_volume(path, frames):
+    code = WRITE_VOLUME.format(sample=os.path.join(PROJECT_DIR, 'samples', 'prueba.dcm'), frames=frames, path=path)
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def run(base, statement):
+    code = CHILD.format(project=PROJECT_DIR, base=base, log=os.path.join(base, 'bench.log'), statement=statement)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=base)
+    elapsed, max_rss_kb = output.stdout.split()
+    return float(elapsed), int(max_rss_kb) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--frames', type=int, default=400)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_volume(os.path.join(tmp, 'volumen.dcm'), args.frames)
+        size_mb = os.path.getsize(os.path.join(tmp, 'volumen.dcm')) / 1e6
+        print(f"Volumen: {args.frames} fotogramas, {size_mb:.0f} MB")
+        print(f"{'modo':>18} {'tiempo (s)':>11} {'pico RSS (MB)':>14}")
+        for label, statement in MODES:
+            elapsed, peak_mb = run(tmp, statement)
+            print(f"{label:>18} {elapsed:>11.2f} {peak_mb:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
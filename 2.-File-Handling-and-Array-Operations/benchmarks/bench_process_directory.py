@@ -0,0 +1,52 @@
+"""
+Benchmark de FileProcessor.process_directory: procesamiento de un estudio DICOM por lotes.
+
+Copia los archivos ``.dcm`` de ``samples/`` N veces en una carpeta temporal
+(repartidos en subcarpetas, como las series de un estudio) y mide archivos/s
+y MB/s con distinto número de procesos, con y sin extracción de imágenes.
+
+Uso:
+    python benchmarks/bench_process_directory.py [--copies 200] [--workers 1 2 4] [--extract-image]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+from Solucion import FileProcessor  # noqa: E402
+
+
+def build_study(folder, copies, series_size=100):
+    samples = os.path.join(PROJECT_DIR, 'samples')
+    sources = sorted(name for name in os.listdir(samples) if name.lower().endswith('.dcm'))
+    for i in range(copies):
+        series = os.path.join(folder, f'serie_{i // series_size:03d}')
+        os.makedirs(series, exist_ok=True)
+        for name in sources:
+            shutil.copyfile(os.path.join(samples, name), os.path.join(series, f'{i:05d}_{name}'))
+    return len(sources) * copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--copies', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    parser.add_argument('--extract-image', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = build_study(os.path.join(tmp, 'estudio'), args.copies)
+        processor = FileProcessor(tmp, os.path.join(tmp, 'bench.log'))
+        print(f"Archivos: {files}, extracción de imagen: {'sí' if args.extract_image else 'no'}")
+        print(f"{'procesos':>9} {'tiempo (s)':>11} {'archivos/s':>11} {'MB/s':>8} {'errores':>8}")
+        for workers in args.workers:
+            batch = processor.process_directory('estudio', extract_image=args.extract_image, workers=workers)
+            print(f"{batch.workers:>9} {batch.seconds:>11.2f} {batch.files_per_second:>11.1f} "
+                  f"{batch.mb_per_second:>8.1f} {len(batch.errors):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark de FileProcessor.read_csv: carga completa frente a lectura por bloques.
+
+Genera un CSV sintético (columnas numéricas y una categórica) y ejecuta cada
+modo en un proceso aparte para medir el tiempo y el pico de memoria (RSS).
+
+Uso:
+    python benchmarks/bench_read_csv.py [--rows 2000000] [--chunksize 200000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import contextlib, io, resource, sys, time
+sys.path.insert(0, {project!r})
+from Solucion import FileProcessor
+processor = FileProcessor({base!r}, {log!r})
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    processor.read_csv({filename!r}, summary=True, chunksize={chunksize!r})
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def write_csv(path, rows, block=500_000):
+    """Escribe el CSV por bloques para no necesitar toda la tabla en memoria"""
+    rng = np.random.default_rng(0)
+    for start in range(0, rows, block):
+        size = min(block, rows - start)
+        pd.DataFrame({
+            'PatientID': [f'p{i}' for i in range(start, start + size)],
+            'Age': rng.integers(18, 90, size),
+            'Weight': rng.normal(75, 10, size).round(1),
+            'Height': rng.normal(170, 8, size).round(1),
+            'Modality': rng.choice(['CT', 'MR', 'XA', 'US', 'CR'], size),
+        }).to_csv(path, mode='a', header=start == 0, index=False)
+
+
+def run(base, filename, chunksize):
+    code = CHILD.format(
+        project=PROJECT_DIR, base=base, log=os.path.join(base, 'bench.log'),
+        filename=filename, chunksize=chunksize
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    elapsed, max_rss_kb = output.stdout.split()
+    return float(elapsed), int(max_rss_kb) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--chunksize', type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_csv(os.path.join(tmp, 'datos.csv'), args.rows)
+        size_mb = os.path.getsize(os.path.join(tmp, 'datos.csv')) / 1e6
+        print(f"CSV: {args.rows} filas, {size_mb:.1f} MB")
+        print(f"{'modo':>22} {'tiempo (s)':>11} {'pico RSS (MB)':>14}")
+        for label, chunksize in (('completo', None), (f'por bloques ({args.chunksize})', args.chunksize)):
+            elapsed, peak_mb = run(tmp, 'datos.csv', chunksize)
+            print(f"{label:>22} {elapsed:>11.2f} {peak_mb:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
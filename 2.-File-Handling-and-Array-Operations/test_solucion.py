@@ -0,0 +1,85 @@
+"""
+Pruebas del análisis de CSV por bloques frente a la carga completa.
+
+Uso:
+    python -m unittest test_solucion
+"""
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from Solucion import FileProcessor
+
+
+def read_csv_output(processor, filename, **kwargs):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        processor.read_csv(filename, summary=True, **kwargs)
+    return output.getvalue()
+
+
+def parse_frequencies(output):
+    """Frecuencias listadas por columna en el resumen de columnas no numéricas"""
+    frequencies = {}
+    column = None
+    for line in output.splitlines():
+        if line.startswith("Columna '"):
+            column = line[len("Columna '"):-2]
+            frequencies[column] = {}
+        elif column and line.startswith('  ') and not line.startswith('  ...'):
+            value, count = line.strip().rsplit(': ', 1)
+            frequencies[column][value] = int(count)
+    return frequencies
+
+
+class ReadCsvInChunksTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.processor = FileProcessor(self.tmp.name, os.path.join(self.tmp.name, 'test.log'))
+
+    def write_csv(self, name, header, rows):
+        with open(os.path.join(self.tmp.name, name), 'w') as f:
+            f.write(header + '\n' + ''.join(row + '\n' for row in rows))
+
+    def test_low_cardinality_matches_full_read(self):
+        self.write_csv('baja.csv', 'n,txt', [f"{i * 0.5},{'abc'[i % 3] * (i % 5 + 1)}" for i in range(5000)])
+        self.assertEqual(
+            read_csv_output(self.processor, 'baja.csv'),
+            read_csv_output(self.processor, 'baja.csv', chunksize=300),
+        )
+
+    def test_blank_first_chunk_and_mixed_types_match_full_read(self):
+        rows = []
+        for i in range(1000):
+            texto = '' if i < 300 else 'abc'[i % 3]
+            mezcla = str(i) if i < 700 else 'xy'[i % 2]
+            rows.append(f"{i},{texto},{mezcla},")
+        self.write_csv('tipos.csv', 'n,texto,mezcla,vacia', rows)
+        self.assertEqual(
+            read_csv_output(self.processor, 'tipos.csv'),
+            read_csv_output(self.processor, 'tipos.csv', chunksize=100),
+        )
+
+    def test_high_cardinality_never_overstates_frequencies(self):
+        self.processor.TOP_K_CAPACITY = 50
+        # Un valor frecuente cada 10 filas; el resto aparece una sola vez
+        rows = [f"{'frecuente' if i % 10 == 0 else f'v{i}'},{i}" for i in range(20000)]
+        self.write_csv('alta.csv', 'valor,n', rows)
+
+        full = parse_frequencies(read_csv_output(self.processor, 'alta.csv'))['valor']
+        output = read_csv_output(self.processor, 'alta.csv', chunksize=1000)
+        self.assertIn('(aprox.)', output)
+        chunked = parse_frequencies(output)['valor']
+
+        self.assertEqual(chunked['frecuente'], full['frecuente'])
+        self.assertEqual(len(chunked), 10)
+        for value, count in chunked.items():
+            true_count = 2000 if value == 'frecuente' else 1
+            self.assertLessEqual(count, true_count, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
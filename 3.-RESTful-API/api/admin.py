@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Device, ImageResult
+from .models import Device, ImageResult, IngestionJob
 
 
 @admin.register(Device)
@@ -20,4 +20,11 @@ class ImageResultAdmin(admin.ModelAdmin):
         "updated_date",
     )
     list_filter = ("device", "created_date", "updated_date")
-    search_fields = ("id",)
\ No newline at end of file
+    search_fields = ("id",)
+
+
+@admin.register(IngestionJob)
+class IngestionJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "status", "processed", "total", "created_date", "updated_date")
+    list_filter = ("status",)
+    exclude = ("payload",)
\ No newline at end of file
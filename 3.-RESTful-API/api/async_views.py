@@ -0,0 +1,91 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_http_methods
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.encoders import JSONEncoder
+
+from . import metrics
+from .device_cache import run_atomic
+from .filters import ImageResultFilter
+from .models import ImageResult
+from .pagination import KeysetPagination
+from .parsers import BINARY_MEDIA_TYPE, decode_payload
+from .serializers import ImageResultSerializer
+from .services import ImageResultService
+
+
+def _json_response(data, status=200):
+    # El encoder de DRF da el mismo formato de fechas que las vistas síncronas
+    return JsonResponse(data, status=status, safe=False, encoder=JSONEncoder)
+
+
+def _create_atomic(payload):
+    """Crea el lote dentro de una transacción (el ORM asíncrono no admite transacciones)"""
+    return run_atomic(lambda: [
+        ImageResultSerializer(result).data
+        for result in ImageResultService.create_from_payload(payload)
+    ])
+
+
+@csrf_exempt
+@require_http_methods(['GET', 'POST'])
+async def elements(request):
+    """Listado y creación de resultados con el ORM asíncrono de Django"""
+    if request.method == 'POST':
+        return await _create(request)
+
+    try:
+        fields = ImageResultSerializer.select_fields(request.GET.get('fields'))
+    except serializers.ValidationError as e:
+        return _json_response(e.detail, status=400)
+
+    filterset = ImageResultFilter(request.GET, queryset=ImageResult.objects.all())
+    if not filterset.is_valid():
+        return _json_response(filterset.errors, status=400)
+
+    query_fields = set(fields).union(KeysetPagination.ordering)
+    queryset = filterset.qs.values(*query_fields)
+
+    paginator = KeysetPagination()
+    try:
+        page = await paginator.apaginate_queryset(queryset, request)
+    except NotFound as e:
+        return _json_response({"detail": e.detail}, status=404)
+
+    data = {
+        "next": paginator.get_next_link(),
+        "results": [{field: row[field] for field in fields} for row in page],
+    }
+    if request.GET.get('count', '').lower() in ('1', 'true'):
+        data["count"] = await filterset.qs.acount()
+    return _json_response(data)
+
+
+async def _create(request):
+    try:
+        with metrics.stage('parse'):
+            if request.content_type == BINARY_MEDIA_TYPE:
+                payload = decode_payload(request.body)
+            else:
+                payload = json.loads(request.body)
+        if not isinstance(payload, dict):
+            raise ValueError("Payload must be a JSON object.")
+        results = await sync_to_async(_create_atomic)(payload)
+    except Exception as e:
+        return _json_response({"error": str(e)}, status=400)
+    return _json_response(results, status=201)
+
+
+@require_GET
+async def element_detail(request, pk):
+    """Detalle de un resultado con ``aget``"""
+    fields = ImageResultSerializer.select_fields()
+    try:
+        result = await ImageResult.objects.values(*fields).aget(pk=pk)
+    except ImageResult.DoesNotExist:
+        return _json_response({"detail": "No ImageResult matches the given query."}, status=404)
+    return _json_response({field: result[field] for field in fields})
@@ -0,0 +1,149 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Device
+
+
+class DeviceCache:
+    """Caché LRU acotada y local al proceso de nombre de dispositivo -> id.
+
+    Los ids solo se guardan cuando se confirma la transacción que los leyó o
+    creó, para no cachear dispositivos que después se deshacen con un rollback.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, name):
+        with self._lock:
+            pk = self._entries.get(name)
+            if pk is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+            return pk
+
+    def _put_many(self, items):
+        with self._lock:
+            for name, pk in items:
+                self._entries[name] = pk
+                self._entries.move_to_end(name)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _put_on_commit(self, items):
+        items = list(items)
+        transaction.on_commit(lambda: self._put_many(items))
+
+    def evict(self, name):
+        with self._lock:
+            self._entries.pop(name, None)
+
+    def evict_missing(self):
+        """Descarta las entradas cuyo dispositivo ya no existe y devuelve cuántas había.
+
+        La señal post_delete solo llega al proceso que borra: los demás siguen
+        con el id antiguo hasta que una inserción falla por la clave foránea.
+        """
+        with self._lock:
+            entries = dict(self._entries)
+        if not entries:
+            return 0
+
+        existing = set(Device.objects.filter(pk__in=set(entries.values())).values_list('pk', flat=True))
+        stale = {name: pk for name, pk in entries.items() if pk not in existing}
+        with self._lock:
+            for name, pk in stale.items():
+                # Solo si no se ha vuelto a resolver mientras tanto
+                if self._entries.get(name) == pk:
+                    del self._entries[name]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_id(self, device_name):
+        """Devuelve el id del dispositivo, creándolo si no existe"""
+        pk = self._get(device_name)
+        if pk is None:
+            # get_or_create resuelve la carrera con la restricción única de device_name
+            device, _ = Device.objects.get_or_create(device_name=device_name)
+            pk = device.pk
+            self._put_on_commit([(device_name, pk)])
+        return pk
+
+    def get_ids(self, device_names):
+        """Devuelve {nombre: id} consultando solo los nombres que no están en caché"""
+        ids = {}
+        missing = set()
+        for name in set(device_names):
+            pk = self._get(name)
+            if pk is None:
+                missing.add(name)
+            else:
+                ids[name] = pk
+
+        if missing:
+            resolved = dict(
+                Device.objects.filter(device_name__in=missing).values_list('device_name', 'id')
+            )
+            to_create = missing - resolved.keys()
+            if to_create:
+                # ignore_conflicts evita fallar si otro proceso crea el mismo dispositivo
+                Device.objects.bulk_create(
+                    [Device(device_name=name) for name in to_create], ignore_conflicts=True
+                )
+                resolved.update(
+                    Device.objects.filter(device_name__in=to_create).values_list('device_name', 'id')
+                )
+            self._put_on_commit(resolved.items())
+            ids.update(resolved)
+        return ids
+
+    def get_stats(self):
+        with self._lock:
+            hits, misses, size = self.hits, self.misses, len(self._entries)
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0,
+            'size': size,
+            'max_size': self.max_size,
+        }
+
+
+device_cache = DeviceCache(settings.DEVICE_CACHE_SIZE)
+
+
+def run_atomic(func):
+    """Ejecuta ``func()`` en una transacción y devuelve su resultado.
+
+    Si la transacción falla por integridad y la caché tenía ids de dispositivos
+    borrados desde otro proceso, se descartan esas entradas y se repite una
+    vez: ``func`` vuelve a resolver esos nombres contra la base de datos.
+    """
+    try:
+        with transaction.atomic():
+            return func()
+    except IntegrityError:
+        if not device_cache.evict_missing():
+            raise
+    with transaction.atomic():
+        return func()
+
+
+@receiver(post_delete, sender=Device)
+def _evict_deleted_device(sender, instance, **kwargs):
+    device_cache.evict(instance.device_name)
@@ -8,6 +8,7 @@ class ImageResultFilter(django_filters.FilterSet):
     average_before_normalization = django_filters.RangeFilter()
     average_after_normalization = django_filters.RangeFilter()
     data_size = django_filters.RangeFilter()
+    device_name = django_filters.CharFilter(field_name='device__device_name')
 
     class Meta:
         model = ImageResult
@@ -17,4 +18,17 @@ class ImageResultFilter(django_filters.FilterSet):
             'average_before_normalization',
             'average_after_normalization',
             'data_size',
+            'device',
         ]
+
+    @classmethod
+    def get_query_params(cls):
+        """Nombres de parámetro aceptados (los filtros de rango usan sufijos _min/_max, _after/_before)"""
+        params = set()
+        for name, filter_ in cls.base_filters.items():
+            widget = filter_.field.widget
+            if hasattr(widget, 'suffixes'):
+                params.update(widget.suffixed(name, suffix) for suffix in widget.suffixes)
+            else:
+                params.add(name)
+        return params
@@ -0,0 +1,119 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .device_cache import run_atomic
+from .models import IngestionJob
+from .services import ImageResultService
+from .streaming import iter_chunks
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Devuelve el pool de workers local del proceso, creándolo la primera vez"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.INGEST_WORKERS,
+                thread_name_prefix='ingest'
+            )
+    return _executor
+
+
+def submit_job(payload):
+    """Guarda el lote como trabajo pendiente y lo encola cuando se confirma la transacción"""
+    job = IngestionJob.objects.create(payload=payload, total=len(payload))
+    transaction.on_commit(lambda: get_executor().submit(run_job, job.pk))
+    return job
+
+
+def _error_detail(error):
+    """Convierte una excepción en un valor serializable a JSON"""
+    if isinstance(error, serializers.ValidationError):
+        return error.detail
+    return str(error)
+
+
+def _process_chunk(chunk):
+    """Procesa un bloque en una sola transacción; si falla, reintenta elemento por elemento"""
+    try:
+        created = run_atomic(lambda: ImageResultService.create_from_payload(dict(chunk)))
+        return {
+            key: {'status': 'created', 'id': result.id}
+            for (key, _), result in zip(chunk, created)
+        }
+    except Exception:
+        pass
+
+    results = {}
+    for key, value in chunk:
+        try:
+            created = run_atomic(lambda: ImageResultService.create_from_payload({key: value}))
+            results[key] = {'status': 'created', 'id': created[0].id}
+        except Exception as e:
+            results[key] = {'status': 'error', 'error': _error_detail(e)}
+    return results
+
+
+def run_job(job_id):
+    """Ejecuta un trabajo de ingesta actualizando el progreso tras cada bloque.
+
+    Las claves que ya tienen resultado se omiten, así que un trabajo
+    interrumpido continúa desde el último bloque guardado.
+    """
+    close_old_connections()
+    try:
+        job = IngestionJob.objects.get(pk=job_id)
+        job.status = IngestionJob.STATUS_RUNNING
+        job.save(update_fields=['status', 'updated_date'])
+
+        remaining = [(key, value) for key, value in job.payload.items() if key not in job.results]
+        for chunk in iter_chunks(remaining, settings.INGEST_CHUNK_SIZE):
+            job.results.update(_process_chunk(chunk))
+            job.processed = len(job.results)
+            job.save(update_fields=['processed', 'results', 'updated_date'])
+
+        job.status = IngestionJob.STATUS_COMPLETED
+        job.save(update_fields=['status', 'updated_date'])
+        logger.info(f"Ingestion job {job_id} completed: {job.processed}/{job.total} elements")
+    except Exception as e:
+        logger.error(f"Ingestion job {job_id} failed: {e}")
+        IngestionJob.objects.filter(pk=job_id).update(
+            status=IngestionJob.STATUS_FAILED, error=str(e)
+        )
+    finally:
+        connection.close()
+
+
+def claim_stale_jobs(stale_seconds):
+    """Reclama los trabajos pendientes o en curso sin avances en ``stale_seconds``.
+
+    Son los que quedaron huérfanos al reiniciarse o caerse el proceso que los
+    tenía en su pool. Cada trabajo se reclama con una actualización
+    condicional sobre ``updated_date``, de modo que si otro proceso lo reclama
+    o avanza a la vez no se ejecuta dos veces. Devuelve los ids reclamados.
+    """
+    cutoff = timezone.now() - timedelta(seconds=stale_seconds)
+    stale = IngestionJob.objects.filter(
+        status__in=[IngestionJob.STATUS_PENDING, IngestionJob.STATUS_RUNNING],
+        updated_date__lt=cutoff
+    ).order_by('created_date').values_list('pk', 'updated_date')
+
+    claimed = []
+    for job_id, updated_date in stale:
+        if IngestionJob.objects.filter(pk=job_id, updated_date=updated_date).update(
+            status=IngestionJob.STATUS_PENDING, updated_date=timezone.now()
+        ):
+            claimed.append(job_id)
+    return claimed
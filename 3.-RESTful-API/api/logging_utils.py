@@ -0,0 +1,67 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+from datetime import datetime, timezone
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatea cada registro como una línea JSON, incluyendo el diccionario ``extra={'data': ...}``"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        data = getattr(record, 'data', None)
+        if isinstance(data, dict):
+            entry.update(data)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class QueueFileHandler(logging.handlers.QueueHandler):
+    """Encola los registros y los escribe en un hilo de fondo.
+
+    El hilo que emite el log solo hace ``queue.put``; el formateo JSON y la
+    escritura a disco ocurren en el ``QueueListener``.
+
+    Por defecto escribe con ``WatchedFileHandler``: cada proceso (workers de
+    gunicorn, pool de ``reprocess``) añade líneas en modo append, lo que es
+    seguro entre procesos, y la rotación la hace una herramienta externa como
+    logrotate (el handler reabre el archivo cuando cambia). Con ``maxBytes``
+    se rota por tamaño con ``RotatingFileHandler``, que solo es seguro si un
+    único proceso escribe en el archivo.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding='utf-8'):
+        super().__init__(queue.SimpleQueue())
+        if maxBytes:
+            self.target = logging.handlers.RotatingFileHandler(
+                filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding, delay=True
+            )
+        else:
+            self.target = logging.handlers.WatchedFileHandler(filename, encoding=encoding, delay=True)
+        self.target.setFormatter(JsonLinesFormatter())
+        self.listener = logging.handlers.QueueListener(self.queue, self.target)
+        self.listener.start()
+        atexit.register(self.close)
+
+    def prepare(self, record):
+        # Sin formatear en el hilo que emite: el listener es el único destino, así
+        # que basta con copiar ``data`` para que el llamador pueda seguir modificándolo
+        data = getattr(record, 'data', None)
+        if isinstance(data, dict):
+            record.data = dict(data)
+        return record
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.target.close()
+        super().close()
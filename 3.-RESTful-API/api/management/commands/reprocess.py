@@ -0,0 +1,172 @@
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Los procesos del pool importan este módulo antes de django.setup(), así que
+# api.reprocessing (que importa los modelos) se importa dentro de cada función
+
+
+def _init_worker():
+    """Inicializa Django en cada proceso del pool (se lanzan con spawn)"""
+    import django
+    django.setup()
+
+
+def _run_shard(index, low, high, batch_size, after, queue):
+    """Procesa un fragmento en un proceso del pool e informa del avance por la cola"""
+    from api.reprocessing import reprocess_range
+
+    rows, missing, seconds = reprocess_range(
+        low, high, batch_size, after=after,
+        progress=lambda last_pk, batch_rows: queue.put((index, last_pk, batch_rows))
+    )
+    return os.getpid(), rows, missing, seconds
+
+
+class Command(BaseCommand):
+    help = "Recalcula las estadísticas de los resultados a partir de las muestras originales guardadas"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help="Resultados leídos y actualizados por bloque"
+        )
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help="Procesos en paralelo (1 ejecuta en el propio proceso)"
+        )
+        parser.add_argument(
+            '--shards', type=int,
+            help="Rangos de clave primaria en que se divide la tabla (por defecto 4 por proceso)"
+        )
+        parser.add_argument(
+            '--checkpoint', default='reprocess-checkpoint.json',
+            help="Archivo con el avance por fragmento para reanudar una ejecución interrumpida"
+        )
+        parser.add_argument(
+            '--restart', action='store_true',
+            help="Ignora el checkpoint existente y empieza desde el principio"
+        )
+
+    def handle(self, *args, **options):
+        from api.reprocessing import load_checkpoint, save_checkpoint, shard_bounds
+
+        batch_size = options['batch_size']
+        workers = max(1, options['workers'])
+        checkpoint_path = options['checkpoint']
+
+        state = None if options['restart'] else load_checkpoint(checkpoint_path)
+        if state is None:
+            shards = options['shards'] or workers * 4
+            state = {'shards': shard_bounds(shards), 'progress': {}}
+            save_checkpoint(checkpoint_path, state)
+        else:
+            self.stdout.write(f"Reanudando desde {checkpoint_path}")
+
+        pending = [
+            index for index in range(len(state['shards']))
+            if not self._progress(state, index)['done']
+        ]
+        self.stdout.write(
+            f"Fragmentos: {len(state['shards'])} ({len(pending)} pendientes), procesos: {workers}"
+        )
+
+        start = time.perf_counter()
+        if workers == 1:
+            results = self._run_serial(state, pending, batch_size, checkpoint_path)
+        else:
+            results = self._run_pool(state, pending, batch_size, checkpoint_path, workers)
+        elapsed = time.perf_counter() - start
+
+        self._report(results, elapsed)
+        # Ejecución completa: la siguiente vuelve a empezar desde el principio
+        os.remove(checkpoint_path)
+
+    @staticmethod
+    def _progress(state, index):
+        return state['progress'].setdefault(str(index), {'after': None, 'rows': 0, 'done': False})
+
+    def _advance(self, state, index, last_pk, rows):
+        progress = self._progress(state, index)
+        progress['after'] = last_pk
+        progress['rows'] += rows
+
+    def _run_serial(self, state, pending, batch_size, checkpoint_path):
+        from api.reprocessing import reprocess_range, save_checkpoint
+
+        results = []
+        for index in pending:
+            low, high = state['shards'][index]
+
+            def progress(last_pk, rows, index=index):
+                self._advance(state, index, last_pk, rows)
+                save_checkpoint(checkpoint_path, state)
+
+            rows, missing, seconds = reprocess_range(
+                low, high, batch_size, after=self._progress(state, index)['after'], progress=progress
+            )
+            self._progress(state, index)['done'] = True
+            save_checkpoint(checkpoint_path, state)
+            results.append((os.getpid(), rows, missing, seconds))
+        return results
+
+    def _run_pool(self, state, pending, batch_size, checkpoint_path, workers):
+        from api.reprocessing import save_checkpoint
+
+        # spawn: los procesos no heredan conexiones abiertas ni hilos del proceso principal
+        context = multiprocessing.get_context('spawn')
+        results = []
+        with context.Manager() as manager, ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_worker
+        ) as pool:
+            queue = manager.Queue()
+            futures = {
+                pool.submit(
+                    _run_shard, index, *state['shards'][index], batch_size,
+                    self._progress(state, index)['after'], queue
+                ): index
+                for index in pending
+            }
+            not_done = set(futures)
+            while not_done:
+                done, not_done = wait(not_done, timeout=1, return_when=FIRST_COMPLETED)
+                # El avance de un fragmento terminado ya está en la cola al completarse su future
+                while not queue.empty():
+                    self._advance(state, *queue.get())
+                for future in done:
+                    index = futures[future]
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        save_checkpoint(checkpoint_path, state)
+                        pool.shutdown(cancel_futures=True)
+                        raise CommandError(
+                            f"Error en el fragmento {index} ({e}). "
+                            f"Vuelva a ejecutar el comando para reanudar desde {checkpoint_path}"
+                        )
+                    self._progress(state, index)['done'] = True
+                save_checkpoint(checkpoint_path, state)
+        return results
+
+    def _report(self, results, elapsed):
+        per_worker = defaultdict(lambda: [0, 0, 0.0])
+        for pid, rows, missing, seconds in results:
+            worker = per_worker[pid]
+            worker[0] += rows
+            worker[1] += missing
+            worker[2] += seconds
+
+        self.stdout.write(f"{'proceso':>10} {'filas':>10} {'sin archivo':>12} {'tiempo (s)':>11} {'filas/s':>10}")
+        for pid, (rows, missing, seconds) in sorted(per_worker.items()):
+            rate = rows / seconds if seconds else 0.0
+            self.stdout.write(f"{pid:>10} {rows:>10} {missing:>12} {seconds:>11.2f} {rate:>10.0f}")
+
+        total = sum(worker[0] for worker in per_worker.values())
+        rate = total / elapsed if elapsed else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"Reprocesados {total} resultados en {elapsed:.2f} s ({rate:.0f} filas/s)"
+        ))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from api.jobs import claim_stale_jobs, run_job
+from api.models import IngestionJob
+
+
+class Command(BaseCommand):
+    help = "Reanuda los trabajos de ingesta asíncrona que quedaron sin terminar tras un reinicio o una caída"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stale-seconds', type=int, default=300,
+            help="Segundos sin avances para considerar huérfano un trabajo pendiente o en curso"
+        )
+
+    def handle(self, *args, **options):
+        job_ids = claim_stale_jobs(options['stale_seconds'])
+        self.stdout.write(f"Trabajos a reanudar: {len(job_ids)}")
+
+        for job_id in job_ids:
+            run_job(job_id)
+            job = IngestionJob.objects.get(pk=job_id)
+            self.stdout.write(f"{job_id}: {job.status} ({job.processed}/{job.total})")
+
+        self.stdout.write(self.style.SUCCESS(f"Reanudados {len(job_ids)} trabajos"))
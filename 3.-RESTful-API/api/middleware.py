@@ -1,30 +1,160 @@
 
 import logging
+import random
 import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from . import metrics
 
 logger = logging.getLogger(__name__)
 
 class LoggingMiddleware:
+    # Funciona tanto en WSGI como en ASGI sin adaptar la cadena de middleware
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        # {prefijo de ruta: fracción de peticiones registradas}; las respuestas con error se registran siempre
+        self.sample_rates = sorted(
+            getattr(settings, 'LOGGING_SAMPLE_RATES', {}).items(),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
-    def __call__(self, request):
-        start_time = time.time()
-        
-        # Registrar la petición
-        log_data = {
+    def _is_sampled(self, path):
+        for prefix, rate in self.sample_rates:
+            if path.startswith(prefix):
+                return random.random() < rate
+        return True
+
+    @staticmethod
+    def _request_data(request, user):
+        return {
             'path': request.path,
             'method': request.method,
-            'user': request.user.username if request.user.is_authenticated else 'AnonymousUser',
+            'user': user.username if user.is_authenticated else 'AnonymousUser',
         }
-        logger.info(f"Request: {log_data}")
+
+    @staticmethod
+    def _log_response(log_data, response, start_time):
+        log_data['status_code'] = response.status_code
+        log_data['duration_ms'] = (time.perf_counter() - start_time) * 1000
+        logger.info("Response", extra={'data': log_data})
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start_time = time.perf_counter()
+        sampled = self._is_sampled(request.path)
+
+        # Registrar la petición
+        log_data = self._request_data(request, request.user)
+        if sampled:
+            logger.info("Request", extra={'data': log_data})
 
         response = self.get_response(request)
 
         # Registrar la respuesta
-        duration = time.time() - start_time
-        log_data['status_code'] = response.status_code
-        log_data['duration_ms'] = duration * 1000
-        logger.info(f"Response: {log_data}")
+        if sampled or response.status_code >= 400:
+            self._log_response(log_data, response, start_time)
+
+        return response
+
+    async def __acall__(self, request):
+        start_time = time.perf_counter()
+        sampled = self._is_sampled(request.path)
+
+        # request.auser() evita la consulta síncrona de sesión en el event loop
+        log_data = self._request_data(request, await request.auser())
+        if sampled:
+            logger.info("Request", extra={'data': log_data})
+
+        response = await self.get_response(request)
+
+        if sampled or response.status_code >= 400:
+            self._log_response(log_data, response, start_time)
+
+        return response
+
+
+# Contador de consultas de la petición en curso. Las conexiones son locales a
+# cada hilo, pero el contexto sí se propaga a sync_to_async, así que el ORM de
+# las vistas asíncronas también suma en el contador de su petición
+_request_queries = ContextVar('request_queries', default=None)
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+
+def _count_queries(execute, sql, params, many, context):
+    counter = _request_queries.get()
+    if counter is not None:
+        counter.count += 1
+    return execute(sql, params, many, context)
+
+
+@receiver(connection_created)
+def _install_query_counter(sender, connection, **kwargs):
+    # Al principio de la lista para que los execute_wrapper temporales lo conserven al salir
+    if _count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _count_queries)
+
+
+class MetricsMiddleware:
+    """Registra latencia, estado y número de consultas SQL por vista y método"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        for connection in connections.all(initialized_only=True):
+            _install_query_counter(None, connection)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _observe(request, response, start_time, queries):
+        # view_name agrupa por ruta (p. ej. imageresult-list) y no por URL concreta
+        match = request.resolver_match
+        view = match.view_name if match is not None else 'unresolved'
+        method = request.method
+        metrics.http_request_duration.observe(time.perf_counter() - start_time, view=view, method=method)
+        metrics.http_request_queries.observe(queries.count, view=view, method=method)
+        metrics.http_requests.inc(view=view, method=method, status=response.status_code)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start_time = time.perf_counter()
+        queries = _QueryCounter()
+        token = _request_queries.set(queries)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_queries.reset(token)
+        self._observe(request, response, start_time, queries)
+        return response
 
+    async def __acall__(self, request):
+        start_time = time.perf_counter()
+        queries = _QueryCounter()
+        token = _request_queries.set(queries)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_queries.reset(token)
+        self._observe(request, response, start_time, queries)
         return response
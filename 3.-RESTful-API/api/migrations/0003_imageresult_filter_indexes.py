@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_ingestionjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='imageresult',
+            index=models.Index(fields=['created_date', 'id'], name='api_ir_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imageresult',
+            index=models.Index(fields=['updated_date'], name='api_ir_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imageresult',
+            index=models.Index(fields=['average_before_normalization'], name='api_ir_avg_before_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imageresult',
+            index=models.Index(fields=['average_after_normalization'], name='api_ir_avg_after_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imageresult',
+            index=models.Index(fields=['data_size'], name='api_ir_data_size_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imageresult',
+            index=models.Index(fields=['device', 'created_date'], name='api_ir_device_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='imageresult',
+            index=models.Index(fields=['device', 'updated_date'], name='api_ir_device_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_imageresult_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageresult',
+            name='raw_data_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_imageresult_raw_data_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageresult',
+            name='statistics',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_imageresult_statistics'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ingestionjob',
+            index=models.Index(fields=['created_date', 'id'], name='api_job_created_id_idx'),
+        ),
+    ]
@@ -1,5 +1,9 @@
+import uuid
+
 from django.db import models
 
+from .response_cache import invalidate_elements
+
 class Device(models.Model):
     device_name = models.CharField(max_length=255, unique=True)
 
@@ -12,9 +16,25 @@ class ImageResult(models.Model):
     average_before_normalization = models.FloatField()
     average_after_normalization = models.FloatField()
     data_size = models.IntegerField()
+    # Mínimo, máximo, desviación estándar y percentiles (ver processing.describe)
+    statistics = models.JSONField(null=True, blank=True, editable=False)
+    # Clave SHA-256 del archivo .npy con las muestras originales (ver api/raw_store.py)
+    raw_data_key = models.CharField(max_length=64, null=True, blank=True, editable=False)
     created_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # Índices para los filtros de ImageResultFilter y la paginación por cursor
+        indexes = [
+            models.Index(fields=['created_date', 'id'], name='api_ir_created_id_idx'),
+            models.Index(fields=['updated_date'], name='api_ir_updated_idx'),
+            models.Index(fields=['average_before_normalization'], name='api_ir_avg_before_idx'),
+            models.Index(fields=['average_after_normalization'], name='api_ir_avg_after_idx'),
+            models.Index(fields=['data_size'], name='api_ir_data_size_idx'),
+            models.Index(fields=['device', 'created_date'], name='api_ir_device_created_idx'),
+            models.Index(fields=['device', 'updated_date'], name='api_ir_device_updated_idx'),
+        ]
+
     def __str__(self):
         return self.id
     
@@ -25,6 +45,39 @@ class ImageResult(models.Model):
     
     def actualizar_dispositivo(self, device_name):
         """Actualiza el dispositivo asociado"""
-        device, _ = Device.objects.get_or_create(device_name=device_name)
-        self.device = device
-        self.save()
\ No newline at end of file
+        from .device_cache import device_cache
+
+        self.device_id = device_cache.get_id(device_name)
+        self.save()
+        invalidate_elements([self.pk])
+
+class IngestionJob(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    payload = models.JSONField()
+    total = models.IntegerField(default=0)
+    processed = models.IntegerField(default=0)
+    results = models.JSONField(default=dict)
+    error = models.TextField(blank=True)
+    created_date = models.DateTimeField(auto_now_add=True)
+    updated_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Índice para la paginación por cursor del listado de trabajos
+        indexes = [
+            models.Index(fields=['created_date', 'id'], name='api_job_created_id_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
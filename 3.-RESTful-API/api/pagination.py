@@ -0,0 +1,105 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Paginación por cursor (keyset) sobre ``(created_date, id)``.
+
+    Cada página continúa a partir de la última fila de la anterior, por lo
+    que el coste no crece con la profundidad como ocurre con OFFSET.
+    """
+    page_size = 100
+    max_page_size = 1000
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    ordering = ('created_date', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    @staticmethod
+    def get_query_params(request):
+        """Parámetros de consulta de una petición DRF o de un ``HttpRequest`` de Django"""
+        return getattr(request, 'query_params', request.GET)
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(self.get_query_params(request).get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def encode_cursor(self, row):
+        created_date, pk = (self._get_value(row, field) for field in self.ordering)
+        # str(): las claves UUID (IngestionJob) no son serializables en JSON
+        raw = json.dumps([created_date.isoformat(), str(pk)]).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    def decode_cursor(self, request):
+        encoded = self.get_query_params(request).get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            created_date, pk = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            return datetime.fromisoformat(created_date), pk
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _get_value(row, field):
+        """Lee un campo tanto de instancias del modelo como de filas ``.values()``"""
+        return row[field] if isinstance(row, dict) else getattr(row, field)
+
+    def _page_queryset(self, queryset, request):
+        """Aplica orden, cursor y límite; pide una fila extra para saber si hay página siguiente"""
+        self.request = request
+        self.page_limit = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            created_date, pk = cursor
+            queryset = queryset.filter(
+                Q(created_date__gt=created_date) | Q(created_date=created_date, id__gt=pk)
+            )
+        return queryset[:self.page_limit + 1]
+
+    def _finish_page(self, page):
+        self.has_next = len(page) > self.page_limit
+        page = page[:self.page_limit]
+        self.next_cursor = self.encode_cursor(page[-1]) if self.has_next else None
+        return page
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self._finish_page(list(self._page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request):
+        """Versión asíncrona de ``paginate_queryset`` para vistas ASGI"""
+        return self._finish_page([row async for row in self._page_queryset(queryset, request)])
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
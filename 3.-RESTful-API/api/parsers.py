@@ -0,0 +1,111 @@
+import json
+import struct
+
+import numpy as np
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+# Tipo MIME del formato binario de ingesta
+BINARY_MEDIA_TYPE = 'application/vnd.medical-api.samples'
+
+# Cabecera del cuerpo: identifica el formato y su versión
+MAGIC = b'MDS1'
+
+# Prefijo de longitud de la cabecera JSON de cada elemento (uint32 little-endian)
+_HEADER_LENGTH = struct.Struct('<I')
+
+# Tipos admitidos para las muestras, siempre little-endian
+DTYPES = {
+    'int16': np.dtype('<i2'),
+    'int32': np.dtype('<i4'),
+}
+
+
+def _smallest_dtype(samples):
+    """Elige el tipo más pequeño en el que caben todas las muestras"""
+    if samples.size == 0:
+        return 'int16'
+    low, high = int(samples.min()), int(samples.max())
+    for name, dtype in DTYPES.items():
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return name
+    raise ValueError("Las muestras no caben en int32")
+
+
+def encode_payload(payload):
+    """Codifica un lote ``{clave: {'id', 'deviceName', 'data'}}`` en el formato binario.
+
+    ``data`` puede ser un array o una lista de números. Cada elemento se
+    escribe como ``[uint32 longitud][cabecera JSON][muestras little-endian]``.
+    """
+    parts = [MAGIC]
+    for key, element in payload.items():
+        samples = np.asarray(element['data']).ravel()
+        dtype = _smallest_dtype(samples)
+        header = json.dumps({
+            'key': str(key),
+            'id': element['id'],
+            'deviceName': element['deviceName'],
+            'dtype': dtype,
+            'count': int(samples.size),
+        }).encode()
+        parts.append(_HEADER_LENGTH.pack(len(header)))
+        parts.append(header)
+        parts.append(samples.astype(DTYPES[dtype], copy=False).tobytes())
+    return b''.join(parts)
+
+
+def decode_payload(body):
+    """Decodifica el formato binario a ``{clave: {'id', 'deviceName', 'data'}}``.
+
+    ``data`` es un array de NumPy que referencia directamente ``body`` sin copiarlo.
+    """
+    view = memoryview(body)
+    if bytes(view[:len(MAGIC)]) != MAGIC:
+        raise ParseError("Invalid binary payload: missing MDS1 signature.")
+
+    payload = {}
+    offset = len(MAGIC)
+    while offset < len(view):
+        if offset + _HEADER_LENGTH.size > len(view):
+            raise ParseError("Invalid binary payload: truncated header length.")
+        (header_length,) = _HEADER_LENGTH.unpack_from(view, offset)
+        offset += _HEADER_LENGTH.size
+
+        try:
+            header = json.loads(bytes(view[offset:offset + header_length]))
+        except ValueError:
+            raise ParseError("Invalid binary payload: malformed element header.")
+        offset += header_length
+        if not isinstance(header, dict):
+            raise ParseError("Invalid binary payload: element header must be a JSON object.")
+
+        dtype = DTYPES.get(header.get('dtype'))
+        if dtype is None:
+            raise ParseError(f"Invalid binary payload: dtype must be one of: {', '.join(DTYPES)}.")
+        count = header.get('count')
+        if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+            raise ParseError("Invalid binary payload: count must be a non-negative integer.")
+        size = count * dtype.itemsize
+        if offset + size > len(view):
+            raise ParseError("Invalid binary payload: truncated sample data.")
+
+        key = str(header.get('key', len(payload)))
+        if key in payload:
+            raise ParseError(f"Invalid binary payload: duplicate key {key}.")
+        payload[key] = {
+            'id': header.get('id'),
+            'deviceName': header.get('deviceName'),
+            'data': np.frombuffer(body, dtype=dtype, count=count, offset=offset),
+        }
+        offset += size
+    return payload
+
+
+class BinaryPayloadParser(BaseParser):
+    """Parser DRF del formato binario de ingesta; ``data`` llega como array de NumPy"""
+    media_type = BINARY_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return decode_payload(stream.read() if stream is not None else b'')
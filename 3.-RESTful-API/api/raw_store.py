@@ -0,0 +1,77 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+# Tipos de almacenamiento, del más pequeño al más grande
+_STORAGE_DTYPES = (np.dtype('<i2'), np.dtype('<i4'), np.dtype('<i8'))
+
+
+def is_enabled():
+    return getattr(settings, 'STORE_RAW_DATA', False)
+
+
+def _root():
+    return Path(settings.RAW_DATA_ROOT)
+
+
+def _compact(samples):
+    """Convierte las muestras al tipo little-endian más pequeño en el que caben"""
+    samples = np.ascontiguousarray(samples).ravel()
+    if samples.size == 0:
+        return samples.astype(_STORAGE_DTYPES[0])
+    low, high = int(samples.min()), int(samples.max())
+    for dtype in _STORAGE_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return samples.astype(dtype, copy=False)
+    raise ValueError("Las muestras no caben en int64")
+
+
+def path_for(key):
+    """Ruta del archivo ``.npy`` de una clave (dos niveles de subdirectorios por prefijo)"""
+    return _root() / key[:2] / key[2:4] / f'{key}.npy'
+
+
+def _key(compacted):
+    digest = hashlib.sha256(compacted.dtype.str.encode())
+    digest.update(memoryview(compacted))
+    return digest.hexdigest()
+
+
+def content_key(samples):
+    """Clave que tendrían las muestras en el almacén, sin escribir nada"""
+    return _key(_compact(samples))
+
+
+def save(samples):
+    """Guarda las muestras como ``.npy`` direccionado por contenido y devuelve su clave.
+
+    La clave es el SHA-256 del tipo y los bytes, así que datos idénticos
+    comparten archivo y guardar de nuevo no vuelve a escribir.
+    """
+    samples = _compact(samples)
+    key = _key(samples)
+
+    path = path_for(key)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Escritura atómica: un lector nunca ve un archivo a medias
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                np.save(tmp, samples, allow_pickle=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return key
+
+
+def load(key, mmap=True):
+    """Carga las muestras de una clave; con ``mmap`` solo se leen las páginas que se usan"""
+    return np.load(path_for(key), mmap_mode='r' if mmap else None, allow_pickle=False)
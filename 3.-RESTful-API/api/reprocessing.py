@@ -0,0 +1,98 @@
+import json
+import os
+import time
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import processing, raw_store, response_cache
+from .models import ImageResult
+
+# Campos recalculados a partir de las muestras originales (bulk_update no aplica auto_now)
+PROCESSED_FIELDS = [
+    'average_before_normalization', 'average_after_normalization', 'data_size', 'statistics', 'updated_date'
+]
+
+
+def reprocessable():
+    """Resultados con muestras originales guardadas, ordenados por clave primaria"""
+    return ImageResult.objects.filter(raw_data_key__isnull=False).order_by('pk')
+
+
+def shard_bounds(shards):
+    """Divide la tabla en ``shards`` rangos ``[inicio, fin)`` de clave primaria de tamaño similar.
+
+    Los límites se leen del índice de la clave primaria con una consulta por
+    fragmento; ``None`` indica un extremo abierto.
+    """
+    queryset = reprocessable().values_list('pk', flat=True)
+    total = queryset.count()
+    shards = max(1, min(shards, total))
+    bounds = [None]
+    for index in range(1, shards):
+        bounds.append(queryset[index * total // shards])
+    bounds.append(None)
+    return list(zip(bounds, bounds[1:]))
+
+
+def reprocess_range(low, high, batch_size, after=None, progress=None):
+    """Recalcula los resultados con clave en ``[low, high)`` posteriores a ``after``.
+
+    Recorre el rango por bloques de ``batch_size`` (paginación por clave, sin
+    cursores abiertos entre transacciones) y guarda cada bloque con
+    ``bulk_update``. Tras confirmar cada bloque llama a ``progress(último_pk, filas)``.
+    Devuelve ``(filas, sin_archivo, segundos)``.
+    """
+    start = time.perf_counter()
+    queryset = reprocessable()
+    if low is not None:
+        queryset = queryset.filter(pk__gte=low)
+    if high is not None:
+        queryset = queryset.filter(pk__lt=high)
+
+    rows = missing = 0
+    while True:
+        page = queryset if after is None else queryset.filter(pk__gt=after)
+        page = list(page.values_list('pk', 'raw_data_key')[:batch_size])
+        if not page:
+            break
+
+        batch = []
+        for pk, key in page:
+            try:
+                # mmap: cada array se lee del disco bajo demanda y no se retiene
+                samples = raw_store.load(key)
+            except FileNotFoundError:
+                missing += 1
+                continue
+            batch.append(ImageResult(
+                pk=pk, updated_date=timezone.now(), **processing.describe(samples)
+            ))
+
+        if batch:
+            with transaction.atomic():
+                ImageResult.objects.bulk_update(batch, PROCESSED_FIELDS)
+                response_cache.invalidate_elements([result.pk for result in batch])
+
+        rows += len(batch)
+        after = page[-1][0]
+        if progress is not None:
+            progress(after, len(batch))
+    return rows, missing, time.perf_counter() - start
+
+
+def load_checkpoint(path):
+    """Estado guardado de una ejecución anterior, o None si no hay checkpoint"""
+    try:
+        with open(path) as checkpoint:
+            return json.load(checkpoint)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path, state):
+    """Escribe el checkpoint de forma atómica"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as checkpoint:
+        json.dump(state, checkpoint)
+    os.replace(tmp_path, path)
@@ -0,0 +1,140 @@
+import hashlib
+import threading
+import time
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+
+_PREFIX = 'elements'
+
+_counters = {'hits': 0, 'misses': 0}
+_counters_lock = threading.Lock()
+
+
+def _count(name):
+    with _counters_lock:
+        _counters[name] += 1
+
+
+def get_stats():
+    """Contadores de aciertos y fallos de la caché de respuestas en este proceso"""
+    with _counters_lock:
+        hits, misses = _counters['hits'], _counters['misses']
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / total if total else 0.0,
+    }
+
+
+def _generation_key(name):
+    return f'{_PREFIX}:{name}:generation'
+
+
+def _generation(name):
+    """Generación actual de un espacio de claves.
+
+    Se usa ``time.time_ns()`` como valor para que, si la clave se expulsa de
+    la caché, la nueva generación nunca coincida con una anterior.
+    """
+    key = _generation_key(name)
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        value = cache.get(key)
+    return value
+
+
+def _bump_generation(name):
+    cache.set(_generation_key(name), time.time_ns(), timeout=None)
+
+
+def list_key(request, namespace='list'):
+    """Clave para respuestas de listado, que dependen de la ruta y los parámetros"""
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    digest = hashlib.sha1(f'{request.path}?{query}'.encode()).hexdigest()
+    return f'{_PREFIX}:{namespace}:{_generation("list")}:{digest}'
+
+
+def detail_key(pk):
+    """Clave para la respuesta de detalle de un resultado"""
+    return f'{_PREFIX}:detail:{_generation("detail")}:{pk}'
+
+
+def _not_modified(request, etag):
+    """Devuelve 304 si el cliente ya tiene la versión indicada por ``etag``"""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        if '*' in etags or etag in etags:
+            return HttpResponseNotModified(headers={'ETag': etag})
+    return None
+
+
+def get_response(request, key):
+    """Construye la respuesta desde la caché, o ``None`` si no hay entrada"""
+    entry = cache.get(key)
+    if entry is None:
+        _count('misses')
+        return None
+    _count('hits')
+
+    content, headers = entry
+    return _not_modified(request, headers['ETag']) or HttpResponse(content, headers=headers)
+
+
+def store_response(request, key, response, timeout=None):
+    """Guarda una respuesta renderizada y le añade ETag (callback post-render)"""
+    etag = quote_etag(hashlib.sha1(response.content).hexdigest())
+    response['ETag'] = etag
+    headers = {
+        name: response[name]
+        for name in ('Content-Type', 'ETag', 'Cache-Control', 'Vary', 'Allow')
+        if response.has_header(name)
+    }
+    if timeout is None:
+        cache.set(key, (response.content, headers))
+    else:
+        cache.set(key, (response.content, headers), timeout)
+    return _not_modified(request, etag)
+
+
+def invalidate_elements(ids=None):
+    """Invalida las respuestas afectadas por una escritura cuando se confirma la transacción.
+
+    Cualquier escritura invalida los listados y estadísticas. Las respuestas
+    de detalle se invalidan solo para ``ids``; con ``ids=None`` se invalidan todas.
+    """
+    ids = None if ids is None else list(ids)
+
+    def _invalidate():
+        _bump_generation('list')
+        if ids is None:
+            _bump_generation('detail')
+        elif ids:
+            cache.delete_many([detail_key(pk) for pk in ids])
+
+    transaction.on_commit(_invalidate)
+
+
+class CachedResponseMixin:
+    """Mixin para ViewSets: cachea respuestas GET en JSON y responde a If-None-Match"""
+
+    def cached_response(self, request, key, build_response, timeout=None):
+        if request.accepted_renderer.format != 'json':
+            return build_response()
+
+        response = get_response(request, key)
+        if response is not None:
+            return response
+
+        response = build_response()
+        if response.status_code == 200:
+            response.add_post_render_callback(
+                lambda rendered: store_response(request, key, rendered, timeout)
+            )
+        return response
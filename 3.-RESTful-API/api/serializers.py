@@ -1,5 +1,8 @@
+import numpy as np
 from rest_framework import serializers
-from .models import Device, ImageResult
+from . import processing
+from .filters import ImageResultFilter
+from .models import Device, ImageResult, IngestionJob
 
 class DeviceSerializer(serializers.ModelSerializer):
     class Meta:
@@ -9,20 +12,91 @@ class DeviceSerializer(serializers.ModelSerializer):
 class ImageResultSerializer(serializers.ModelSerializer):
     class Meta:
         model = ImageResult
-        fields = '__all__'
+        # Las muestras originales solo se devuelven bajo petición (?include=raw_data)
+        exclude = ['raw_data_key']
+
+    @classmethod
+    def select_fields(cls, requested=None):
+        """Campos pedidos como lista separada por comas, en el orden del serializador"""
+        available = list(cls().fields)
+        if not requested:
+            return available
+
+        requested = {field.strip() for field in requested.split(',') if field.strip()}
+        unknown = requested.difference(available)
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": f"Unknown fields: {', '.join(sorted(unknown))}."}
+            )
+        return [field for field in available if field in requested]
+
+class IngestionJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = IngestionJob
+        exclude = ['payload']
+
+class IngestionJobListSerializer(serializers.ModelSerializer):
+    """Estado y progreso sin los resultados por elemento, que solo se devuelven en el detalle"""
+
+    class Meta:
+        model = IngestionJob
+        exclude = ['payload', 'results']
+
+class IdMappingSerializer(serializers.Serializer):
+    mapping = serializers.DictField(child=serializers.CharField(max_length=255))
+
+    def validate_mapping(self, value):
+        if not value:
+            raise serializers.ValidationError("Mapping cannot be empty.")
+        return value
+
+class BulkSelectionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.CharField(max_length=255), required=False)
+    filter = serializers.DictField(required=False)
+
+    def validate_filter(self, value):
+        if not value:
+            raise serializers.ValidationError("Filter cannot be empty.")
+        unknown = set(value) - ImageResultFilter.get_query_params()
+        if unknown:
+            raise serializers.ValidationError(f"Unknown filter parameters: {', '.join(sorted(unknown))}.")
+        return value
+
+    def validate(self, attrs):
+        if ('ids' in attrs) == ('filter' in attrs):
+            raise serializers.ValidationError("Provide exactly one of 'ids' or 'filter'.")
+        return attrs
+
+class BulkUpdateSerializer(BulkSelectionSerializer):
+    device_name = serializers.CharField(max_length=255)
+
+class SampleDataField(serializers.ListField):
+    """Lista de filas de texto o array de NumPy ya decodificado por ``BinaryPayloadParser``"""
+
+    def to_internal_value(self, data):
+        if isinstance(data, np.ndarray):
+            if data.dtype.kind != 'i':
+                raise serializers.ValidationError("All items in data must be numbers.")
+            return data
+        return super().to_internal_value(data)
 
 class InputDataSerializer(serializers.Serializer):
     id = serializers.CharField()
-    data = serializers.ListField(child=serializers.CharField())
+    data = SampleDataField(child=serializers.CharField())
     deviceName = serializers.CharField()
 
     def validate_data(self, value):
-        flat_data = []
-        for item in value:
-            try:
-                flat_data.extend([int(num) for num in item.split()])
-            except ValueError:
-                raise serializers.ValidationError("All items in data must be numbers.")
-        if not flat_data:
+        if isinstance(value, np.ndarray):
+            samples = processing.as_sample_array(value)
+            if samples.size == 0:
+                raise serializers.ValidationError("Data cannot be empty.")
+            return samples
+        try:
+            samples = processing.parse_rows(value)
+        except ValueError:
+            raise serializers.ValidationError("All items in data must be numbers.")
+        except OverflowError:
+            raise serializers.ValidationError("Data values are out of the supported integer range.")
+        if samples.size == 0:
             raise serializers.ValidationError("Data cannot be empty.")
-        return flat_data
\ No newline at end of file
+        return samples
\ No newline at end of file
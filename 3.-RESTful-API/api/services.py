@@ -1,78 +1,428 @@
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Case, CharField, Value, When
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Device, ImageResult
+from . import metrics, processing, raw_store, response_cache
+from .device_cache import device_cache, run_atomic
+from .streaming import iter_chunks, iter_object_items
+from .models import ImageResult
 from .serializers import InputDataSerializer
 
+# Número de ids renombrados por sentencia UPDATE
+REMAP_BATCH_SIZE = 500
+
+# Columnas que deben coincidir para considerar idéntico un resultado ya existente
+CONTENT_FIELDS = ('device_id', 'average_before_normalization', 'average_after_normalization', 'data_size')
+
+# Estados por elemento de la ingesta idempotente
+STATUS_CREATED = 'created'
+STATUS_UNCHANGED = 'unchanged'
+STATUS_CONFLICT = 'conflict'
+STATUS_ERROR = 'error'
+
 
 class ImageResultService:
     @staticmethod
     def process_medical_data(flat_data):
-        """Calcula normalización y promedios de datos médicos"""
-        if not flat_data:
-            raise ValueError("Los datos no pueden estar vacíos")
-        
-        max_value = max(flat_data)
-        normalized_data = [x / max_value for x in flat_data]
-        
-        avg_before = sum(flat_data) / len(flat_data)
-        avg_after = sum(normalized_data) / len(normalized_data)
-        
-        return {
-            'average_before_normalization': avg_before,
-            'average_after_normalization': avg_after,
-            'data_size': len(flat_data)
-        }
+        """Calcula normalización, promedios y estadísticas extendidas de datos médicos"""
+        return processing.describe(flat_data)
     
     @staticmethod
-    def create_from_payload(payload):
+    def create_from_payload(payload, bulk=True):
         """Procesa un lote completo de datos médicos"""
+        if bulk:
+            return ImageResultService.bulk_create_from_payload(payload)
+        
         results = []
         
         for key, value in payload.items():
-            serializer = InputDataSerializer(data=value)
-            if not serializer.is_valid():
+            with metrics.stage('validate'):
+                serializer = InputDataSerializer(data=value)
+                valid = serializer.is_valid()
+            if not valid:
                 raise serializers.ValidationError(serializer.errors)
             
             validated_data = serializer.validated_data
             device_name = validated_data.get('deviceName')
-            device, _ = Device.objects.get_or_create(device_name=device_name)
+            with metrics.stage('device_lookup'):
+                device_id = device_cache.get_id(device_name)
             
             # Verificar duplicado
-            if ImageResult.id_exists(validated_data.get('id')):
+            with metrics.stage('duplicate_check'):
+                exists = ImageResult.id_exists(validated_data.get('id'))
+            if exists:
                 raise serializers.ValidationError(
                     f"ImageResult with id {validated_data.get('id')} already exists."
                 )
             
             # Procesar datos médicos
             flat_data = validated_data.get('data', [])
-            processed_data = ImageResultService.process_medical_data(flat_data)
+            with metrics.stage('process'):
+                processed_data = ImageResultService.process_medical_data(flat_data)
+            if raw_store.is_enabled():
+                with metrics.stage('store_raw'):
+                    processed_data['raw_data_key'] = raw_store.save(flat_data)
             
             # Crear resultado
-            image_result = ImageResult.objects.create(
-                id=validated_data.get('id'),
-                device=device,
+            with metrics.stage('insert'):
+                image_result = ImageResult.objects.create(
+                    id=validated_data.get('id'),
+                    device_id=device_id,
+                    **processed_data
+                )
+            results.append(image_result)
+        
+        metrics.ingest_elements.inc(len(results))
+        response_cache.invalidate_elements([])
+        return results
+    
+    @staticmethod
+    def resolve_devices(device_names):
+        """Obtiene los ids de los dispositivos por nombre, creando en bloque los que falten"""
+        return device_cache.get_ids(device_names)
+    
+    @staticmethod
+    def bulk_create_from_payload(payload):
+        """Procesa un lote completo con consultas e inserciones en bloque"""
+        # Validar en orden hasta el primer elemento inválido (igual que el modo por elemento)
+        elements = []
+        invalid_errors = None
+        with metrics.stage('validate'):
+            for key, value in payload.items():
+                serializer = InputDataSerializer(data=value)
+                if not serializer.is_valid():
+                    invalid_errors = serializer.errors
+                    break
+                elements.append(serializer.validated_data)
+        
+        # Verificar duplicados con una sola consulta
+        ids = [element['id'] for element in elements]
+        with metrics.stage('duplicate_check'):
+            existing_ids = set(
+                ImageResult.objects.filter(id__in=ids).values_list('id', flat=True)
+            )
+        seen_ids = set()
+        for element_id in ids:
+            if element_id in existing_ids or element_id in seen_ids:
+                raise serializers.ValidationError(
+                    f"ImageResult with id {element_id} already exists."
+                )
+            seen_ids.add(element_id)
+        
+        if invalid_errors is not None:
+            raise serializers.ValidationError(invalid_errors)
+        
+        with metrics.stage('device_lookup'):
+            devices = ImageResultService.resolve_devices(
+                element['deviceName'] for element in elements
+            )
+        
+        with metrics.stage('process'):
+            processed = [
+                ImageResultService.process_medical_data(element['data']) for element in elements
+            ]
+        
+        if raw_store.is_enabled():
+            # Se escriben antes de confirmar: tras un rollback quedan archivos sin
+            # referencia, pero nunca un resultado apuntando a un archivo inexistente
+            with metrics.stage('store_raw'):
+                for element, processed_data in zip(elements, processed):
+                    processed_data['raw_data_key'] = raw_store.save(element['data'])
+        
+        image_results = [
+            ImageResult(
+                id=element['id'],
+                device_id=devices[element['deviceName']],
                 **processed_data
             )
-            results.append(image_result)
+            for element, processed_data in zip(elements, processed)
+        ]
+        with metrics.stage('insert'):
+            created = ImageResult.objects.bulk_create(image_results)
+        metrics.ingest_elements.inc(len(created))
+        # Los ids nuevos no tienen respuestas de detalle cacheadas: basta con los listados
+        response_cache.invalidate_elements([])
+        return created
+    
+    @staticmethod
+    def _same_content(current, row):
+        """Compara un resultado guardado con el calculado para un elemento"""
+        if any(current[field] != row[field] for field in CONTENT_FIELDS):
+            return False
+        # Con muestras guardadas en ambos se compara además su hash
+        keys = current.get('raw_data_key'), row.get('raw_data_key')
+        return None in keys or keys[0] == keys[1]
+    
+    @staticmethod
+    def upsert_from_payload(payload):
+        """Ingesta idempotente: devuelve el estado de cada clave del lote.
+        
+        Los ids que ya existen con el mismo contenido no cambian nada
+        (``unchanged``) y los que existen con otro contenido se informan como
+        ``conflict`` sin deshacer el resto. Los nuevos se insertan con
+        ``ON CONFLICT DO NOTHING``, así que reintentar un lote ya guardado
+        cuesta una consulta y ninguna escritura.
+        """
+        elements = {}
+        with metrics.stage('validate'):
+            for key, value in payload.items():
+                serializer = InputDataSerializer(data=value)
+                if not serializer.is_valid():
+                    raise serializers.ValidationError(serializer.errors)
+                elements[key] = serializer.validated_data
+        
+        with metrics.stage('device_lookup'):
+            devices = ImageResultService.resolve_devices(
+                element['deviceName'] for element in elements.values()
+            )
+        
+        with metrics.stage('process'):
+            rows = {
+                key: {
+                    'device_id': devices[element['deviceName']],
+                    **ImageResultService.process_medical_data(element['data'])
+                }
+                for key, element in elements.items()
+            }
+        store_raw = raw_store.is_enabled()
+        if store_raw:
+            for key, element in elements.items():
+                rows[key]['raw_data_key'] = raw_store.content_key(element['data'])
+        
+        # Una sola consulta con el contenido de los ids que ya existen
+        with metrics.stage('duplicate_check'):
+            existing = {
+                row['id']: row
+                for row in ImageResult.objects.filter(
+                    id__in=[element['id'] for element in elements.values()]
+                ).values('id', 'raw_data_key', *CONTENT_FIELDS)
+            }
         
+        results = {}
+        to_create = {}
+        for key, element in elements.items():
+            element_id = element['id']
+            row = rows[key]
+            # Un id repetido dentro del lote se compara con su primera aparición
+            current = existing.get(element_id) or to_create.get(element_id)
+            if current is None:
+                to_create[element_id] = row
+                status = STATUS_CREATED
+            elif ImageResultService._same_content(current, row):
+                status = STATUS_UNCHANGED
+            else:
+                status = STATUS_CONFLICT
+            results[key] = {'id': element_id, 'status': status}
+        
+        if to_create:
+            if store_raw:
+                with metrics.stage('store_raw'):
+                    for key, element in elements.items():
+                        if results[key]['status'] == STATUS_CREATED:
+                            raw_store.save(element['data'])
+            with metrics.stage('insert'):
+                ImageResult.objects.bulk_create(
+                    [ImageResult(id=element_id, **row) for element_id, row in to_create.items()],
+                    ignore_conflicts=True
+                )
+            
+            # Un id insertado por otra petición entre la consulta y el INSERT se
+            # ignora en la base de datos: se comprueba que el contenido sea el nuestro
+            stored = {
+                row['id']: row
+                for row in ImageResult.objects.filter(id__in=list(to_create)).values(
+                    'id', 'raw_data_key', *CONTENT_FIELDS
+                )
+            }
+            for result in results.values():
+                element_id = result['id']
+                if (result['status'] == STATUS_CREATED
+                        and not ImageResultService._same_content(stored[element_id], to_create[element_id])):
+                    result['status'] = STATUS_CONFLICT
+            
+            metrics.ingest_elements.inc(len(to_create))
+            response_cache.invalidate_elements([])
+        
+        for result in results.values():
+            if result['status'] == STATUS_CONFLICT:
+                result['error'] = f"ImageResult with id {result['id']} already exists with different content."
         return results
     
+    @staticmethod
+    def partial_create_from_payload(payload):
+        """Inserta los elementos válidos del lote y devuelve el resultado de cada clave.
+        
+        Todos los elementos se validan antes de escribir; los inválidos o con id
+        duplicado se descartan sin abrir un savepoint por fila y el resto se
+        inserta con un único ``bulk_create``.
+        """
+        results = {}
+        elements = {}
+        with metrics.stage('validate'):
+            for key, value in payload.items():
+                serializer = InputDataSerializer(data=value)
+                if serializer.is_valid():
+                    elements[key] = serializer.validated_data
+                else:
+                    element_id = value.get('id') if isinstance(value, dict) else None
+                    results[key] = {'id': element_id, 'status': STATUS_ERROR, 'error': serializer.errors}
+        
+        with metrics.stage('duplicate_check'):
+            existing_ids = set(
+                ImageResult.objects.filter(
+                    id__in=[element['id'] for element in elements.values()]
+                ).values_list('id', flat=True)
+            )
+        valid = {}
+        for key, element in elements.items():
+            element_id = element['id']
+            if element_id in existing_ids:
+                results[key] = {
+                    'id': element_id,
+                    'status': STATUS_ERROR,
+                    'error': f"ImageResult with id {element_id} already exists.",
+                }
+            else:
+                # Un id repetido dentro del lote cuenta como existente a partir de la segunda vez
+                existing_ids.add(element_id)
+                valid[key] = element
+        
+        # Los datos que no se pueden normalizar (p. ej. todo ceros) también se rechazan por elemento
+        processed = {}
+        with metrics.stage('process'):
+            for key, element in list(valid.items()):
+                try:
+                    processed[key] = ImageResultService.process_medical_data(element['data'])
+                except ValueError as e:
+                    results[key] = {'id': element['id'], 'status': STATUS_ERROR, 'error': str(e)}
+                    del valid[key]
+        
+        if valid:
+            with metrics.stage('device_lookup'):
+                devices = ImageResultService.resolve_devices(
+                    element['deviceName'] for element in valid.values()
+                )
+            rows = {
+                element['id']: {'device_id': devices[element['deviceName']], **processed[key]}
+                for key, element in valid.items()
+            }
+            if raw_store.is_enabled():
+                with metrics.stage('store_raw'):
+                    for element in valid.values():
+                        rows[element['id']]['raw_data_key'] = raw_store.save(element['data'])
+            with metrics.stage('insert'):
+                ImageResult.objects.bulk_create(
+                    [ImageResult(id=element_id, **row) for element_id, row in rows.items()],
+                    ignore_conflicts=True
+                )
+            
+            # Los ids insertados por otra petición entre la consulta y el INSERT se
+            # ignoran en la base de datos: solo cuentan como creados si el contenido es el nuestro
+            stored = {
+                row['id']: row
+                for row in ImageResult.objects.filter(id__in=list(rows)).values(
+                    'id', 'raw_data_key', *CONTENT_FIELDS
+                )
+            }
+            for key, element in valid.items():
+                element_id = element['id']
+                if ImageResultService._same_content(stored[element_id], rows[element_id]):
+                    results[key] = {'id': element_id, 'status': STATUS_CREATED}
+                else:
+                    results[key] = {
+                        'id': element_id,
+                        'status': STATUS_ERROR,
+                        'error': f"ImageResult with id {element_id} already exists.",
+                    }
+            
+            metrics.ingest_elements.inc(len(rows))
+            response_cache.invalidate_elements([])
+        
+        # Mismo orden que el lote recibido
+        return {key: results[key] for key in payload}
+    
+    @staticmethod
+    def ingest_stream(stream, chunk_size):
+        """Procesa un lote JSON leído de forma incremental, confirmando cada bloque por separado"""
+        processed = 0
+        items = iter_object_items(stream, max_value_size=settings.INGEST_MAX_ELEMENT_SIZE)
+        for number, chunk in enumerate(iter_chunks(items, chunk_size), start=1):
+            results = run_atomic(lambda: ImageResultService.create_from_payload(dict(chunk)))
+            processed += len(results)
+            yield {
+                'chunk': number,
+                'elements': len(results),
+                'processed': processed,
+            }
+    
     @staticmethod
     def change_id(instance, new_id):
-        """Cambia el ID de un ImageResult (crear nuevo + eliminar anterior)"""
-        if ImageResult.id_exists(new_id):
-            raise serializers.ValidationError(f"ImageResult with id {new_id} already exists.")
-        
-        # Crear nuevo registro con el nuevo ID
-        new_instance = ImageResult.objects.create(
-            id=new_id,
-            device=instance.device,
-            average_before_normalization=instance.average_before_normalization,
-            average_after_normalization=instance.average_after_normalization,
-            data_size=instance.data_size
-        )
+        """Cambia el ID de un ImageResult con un UPDATE en el mismo registro"""
+        ImageResultService.remap_ids({instance.pk: new_id})
+        instance.pk = new_id
+        return instance
+    
+    @staticmethod
+    def remap_ids(mapping, batch_size=REMAP_BATCH_SIZE):
+        """Renombra ids en bloque (anterior -> nuevo) conservando el resto de columnas y las fechas"""
+        mapping = {old_id: new_id for old_id, new_id in mapping.items() if old_id != new_id}
+        if not mapping:
+            return 0
         
-        # Eliminar el registro original
-        instance.delete()
+        new_ids = list(mapping.values())
+        if len(set(new_ids)) != len(new_ids):
+            raise serializers.ValidationError("New ids must be unique.")
+        chained = set(mapping).intersection(new_ids)
+        if chained:
+            raise serializers.ValidationError(
+                f"Ids cannot be both renamed and used as a new id: {', '.join(sorted(chained))}."
+            )
         
-        return new_instance 
\ No newline at end of file
+        # Una sola consulta detecta ids inexistentes y colisiones
+        found = set(
+            ImageResult.objects.filter(id__in=set(mapping).union(new_ids)).values_list('id', flat=True)
+        )
+        collisions = found.intersection(new_ids)
+        if collisions:
+            if len(collisions) == 1:
+                raise serializers.ValidationError(
+                    f"ImageResult with id {collisions.pop()} already exists."
+                )
+            raise serializers.ValidationError({"collisions": sorted(collisions)})
+        missing = set(mapping) - found
+        if missing:
+            raise serializers.ValidationError({"missing": sorted(missing)})
+        
+        updated = 0
+        with transaction.atomic():
+            for batch in iter_chunks(mapping.items(), batch_size):
+                updated += ImageResult.objects.filter(
+                    id__in=[old_id for old_id, _ in batch]
+                ).update(
+                    id=Case(
+                        *[When(id=old_id, then=Value(new_id)) for old_id, new_id in batch],
+                        output_field=CharField()
+                    )
+                )
+            response_cache.invalidate_elements(list(mapping) + new_ids)
+        return updated
+    
+    @staticmethod
+    def bulk_update_device(queryset, device_name, ids=None):
+        """Reasigna el dispositivo de todos los resultados del queryset con un solo UPDATE"""
+        def update():
+            device_id = device_cache.get_id(device_name)
+            # QuerySet.update() no aplica auto_now: se actualiza la fecha explícitamente
+            updated = queryset.update(device_id=device_id, updated_date=timezone.now())
+            response_cache.invalidate_elements(ids)
+            return updated
+        return run_atomic(update)
+    
+    @staticmethod
+    def bulk_delete(queryset, ids=None):
+        """Elimina todos los resultados del queryset con un solo DELETE"""
+        with transaction.atomic():
+            deleted, _ = queryset.delete()
+            response_cache.invalidate_elements(ids)
+        return deleted
@@ -0,0 +1,129 @@
+import codecs
+import json
+from itertools import islice
+
+# Tamaño de lectura por defecto del cuerpo de la petición (bytes)
+DEFAULT_READ_SIZE = 64 * 1024
+
+# Tamaño máximo por defecto de un valor JSON retenido en el buffer (caracteres)
+DEFAULT_MAX_VALUE_SIZE = 64 * 1024 * 1024
+
+# Un error de decodificación a más distancia del final del buffer no se corrige
+# leyendo más datos: solo un literal o un escape cortado (``-Infinit``, ``\u00``)
+# puede fallar antes del final
+_MAX_PARTIAL_TOKEN = 16
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _StreamBuffer:
+    """Buffer de texto sobre un stream de bytes que solo retiene el valor en curso"""
+
+    def __init__(self, stream, read_size, max_value_size=DEFAULT_MAX_VALUE_SIZE):
+        self.stream = stream
+        self.read_size = read_size
+        self.max_value_size = max_value_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = stream is None
+
+    def fill(self, size=None):
+        """Lee más datos del stream descartando lo ya consumido"""
+        if self.eof:
+            return False
+        chunk = self.stream.read(size or self.read_size)
+        if not chunk:
+            self.eof = True
+        text = self.decoder.decode(chunk or b'', final=self.eof)
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Devuelve el siguiente carácter no blanco sin consumirlo ('' al final)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        """Consume el carácter esperado o lanza un error"""
+        if self.peek() != char:
+            raise ValueError(f"JSON inválido: se esperaba '{char}'")
+        self.pos += 1
+
+    def expect_end(self):
+        """Verifica que no queden datos después del objeto principal"""
+        if self.peek():
+            raise ValueError("JSON inválido: datos adicionales después del objeto principal")
+
+    def decode_value(self):
+        """Decodifica el siguiente valor JSON completo, leyendo más datos si es necesario"""
+        self.peek()
+        read_size = self.read_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                truncated = (e.msg.startswith('Unterminated string')
+                             or len(self.buffer) - e.pos <= _MAX_PARTIAL_TOKEN)
+                if not truncated:
+                    raise ValueError(f"JSON inválido: {e.msg}")
+                pending = len(self.buffer) - self.pos
+                if pending > self.max_value_size:
+                    raise ValueError(
+                        f"JSON inválido: un valor supera el tamaño máximo de {self.max_value_size} caracteres"
+                    )
+                if not self.fill(min(read_size, self.max_value_size + 1 - pending)):
+                    raise ValueError(f"JSON inválido: {e.msg}")
+                # Crecimiento geométrico para no redecodificar valores grandes muchas veces
+                read_size *= 2
+                continue
+            # Un número al final del buffer podría continuar en la siguiente lectura
+            if end == len(self.buffer) and not isinstance(value, (str, dict, list)):
+                if self.fill(read_size):
+                    continue
+            self.pos = end
+            return value
+
+
+def iter_object_items(stream, read_size=DEFAULT_READ_SIZE, max_value_size=DEFAULT_MAX_VALUE_SIZE):
+    """Recorre de forma incremental los pares clave/valor de un objeto JSON de primer nivel.
+
+    Solo se mantiene en memoria el elemento que se está decodificando, por lo
+    que el consumo no depende del tamaño total del cuerpo; un elemento de más
+    de ``max_value_size`` caracteres se rechaza sin seguir leyendo.
+    """
+    reader = _StreamBuffer(stream, read_size, max_value_size)
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.pos += 1
+        reader.expect_end()
+        return
+
+    while True:
+        key = reader.decode_value()
+        if not isinstance(key, str):
+            raise ValueError("JSON inválido: las claves del objeto deben ser cadenas")
+        reader.expect(':')
+        yield key, reader.decode_value()
+
+        separator = reader.peek()
+        if separator == '}':
+            reader.pos += 1
+            break
+        reader.expect(',')
+    reader.expect_end()
+
+
+def iter_chunks(items, chunk_size):
+    """Agrupa un iterable en listas de hasta ``chunk_size`` elementos"""
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
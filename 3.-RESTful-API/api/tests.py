@@ -1,3 +1,329 @@
-from django.test import TestCase
+import numpy as np
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase
 
-# Crea tus pruebas aquí.
+from . import processing
+from .device_cache import device_cache
+from .models import ImageResult, IngestionJob
+from .serializers import InputDataSerializer
+from .services import ImageResultService
+
+ELEMENTS_URL = '/api/elements/'
+
+
+def element(element_id, data, device_name='CT'):
+    return {'id': element_id, 'data': data, 'deviceName': device_name}
+
+
+class DeviceCacheResetMixin:
+    """Cada prueba revierte su transacción: los ids de dispositivo cacheados dejan de existir"""
+
+    def setUp(self):
+        super().setUp()
+        device_cache.clear()
+
+
+class UpsertModeTests(DeviceCacheResetMixin, APITestCase):
+    url = ELEMENTS_URL + '?mode=upsert'
+
+    def test_repeated_batch_is_unchanged(self):
+        payload = {'a': element('u1', ['1 2 3']), 'b': element('u2', ['4 5 6'])}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['created'], 2)
+
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual((body['created'], body['unchanged'], body['conflict']), (0, 2, 0))
+        self.assertEqual(body['results']['a'], {'id': 'u1', 'status': 'unchanged'})
+
+    def test_conflict_does_not_undo_the_rest(self):
+        self.client.post(self.url, {'a': element('u1', ['1 2 3'])}, format='json')
+
+        payload = {'a': element('u1', ['1 2 4']), 'b': element('u2', ['4 5 6'])}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        results = response.json()['results']
+        self.assertEqual(results['a']['status'], 'conflict')
+        self.assertIn('different content', results['a']['error'])
+        self.assertEqual(results['b'], {'id': 'u2', 'status': 'created'})
+        self.assertEqual(ImageResult.objects.get(id='u1').data_size, 3)
+        self.assertTrue(ImageResult.objects.filter(id='u2').exists())
+
+    def test_repeated_id_within_batch(self):
+        payload = {
+            'a': element('u1', ['1 2 3']),
+            'b': element('u1', ['1 2 3']),
+            'c': element('u1', ['7 8']),
+        }
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        results = response.json()['results']
+        self.assertEqual([results[key]['status'] for key in 'abc'], ['created', 'unchanged', 'conflict'])
+        self.assertEqual(ImageResult.objects.filter(id='u1').count(), 1)
+        self.assertEqual(ImageResult.objects.get(id='u1').data_size, 3)
+
+    def test_invalid_element_rejects_batch(self):
+        payload = {'a': element('u1', ['1 2 3']), 'b': element('u2', ['x'])}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ImageResult.objects.exists())
+
+
+class PartialModeTests(DeviceCacheResetMixin, APITestCase):
+    url = ELEMENTS_URL + '?mode=partial'
+
+    def test_all_valid_returns_201(self):
+        payload = {'a': element('p1', ['1 2 3']), 'b': element('p2', ['4 5 6'], 'MR')}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['created'], 2)
+        self.assertEqual(response.json()['failed'], 0)
+
+    def test_mixed_batch_returns_207_per_key(self):
+        ImageResultService.create_from_payload({'x': element('p0', ['9'])})
+
+        payload = {
+            'a': element('p1', ['1 2 3']),
+            'b': element('p2', ['4 x 6']),
+            'c': element('p0', ['1']),
+            'd': element('p1', ['7']),
+            'e': 'junk',
+            'f': element('p3', ['0 0']),
+        }
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        body = response.json()
+        self.assertEqual((body['created'], body['failed']), (1, 5))
+        results = body['results']
+        self.assertEqual(list(results), list(payload))
+        self.assertEqual(results['a'], {'id': 'p1', 'status': 'created'})
+        self.assertEqual(results['b']['id'], 'p2')
+        self.assertEqual(results['b']['status'], 'error')
+        self.assertEqual(results['c']['error'], 'ImageResult with id p0 already exists.')
+        self.assertEqual(results['d']['error'], 'ImageResult with id p1 already exists.')
+        self.assertEqual(results['e']['id'], None)
+        self.assertEqual(results['e']['status'], 'error')
+        self.assertEqual(results['f']['status'], 'error')
+        self.assertEqual(
+            set(ImageResult.objects.values_list('id', flat=True)), {'p0', 'p1'}
+        )
+        self.assertEqual(ImageResult.objects.get(id='p1').data_size, 3)
+
+    def test_no_valid_element_returns_400(self):
+        ImageResultService.create_from_payload({'x': element('p0', ['9'])})
+
+        payload = {'a': element('p0', ['1']), 'b': element('p1', ['x'])}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        body = response.json()
+        self.assertEqual((body['created'], body['failed']), (0, 2))
+        self.assertEqual({result['status'] for result in body['results'].values()}, {'error'})
+        self.assertEqual(ImageResult.objects.count(), 1)
+
+
+class BulkCreateOrderTests(DeviceCacheResetMixin, TestCase):
+    """El modo en bloque informa el mismo primer error que el modo por elemento"""
+
+    def setUp(self):
+        super().setUp()
+        ImageResultService.create_from_payload({'x': element('b0', ['9'])})
+
+    def first_error(self, payload, bulk):
+        with self.assertRaises(serializers.ValidationError) as raised:
+            ImageResultService.create_from_payload(payload, bulk=bulk)
+        return raised.exception.detail
+
+    def assert_same_error(self, payload):
+        bulk_error = self.first_error(payload, bulk=True)
+        self.assertEqual(bulk_error, self.first_error(payload, bulk=False))
+        return bulk_error
+
+    def test_duplicate_before_invalid(self):
+        error = self.assert_same_error({'a': element('b0', ['1']), 'b': element('b1', ['x'])})
+        self.assertEqual(error, ['ImageResult with id b0 already exists.'])
+
+    def test_repeated_id_before_invalid(self):
+        error = self.assert_same_error({
+            'a': element('b1', ['1']), 'b': element('b1', ['2']), 'c': element('b2', ['x']),
+        })
+        self.assertEqual(error, ['ImageResult with id b1 already exists.'])
+
+    def test_invalid_before_duplicate(self):
+        error = self.assert_same_error({'a': element('b1', ['x']), 'b': element('b0', ['1'])})
+        self.assertIn('data', error)
+
+    def test_failed_batch_writes_nothing(self):
+        self.first_error({'a': element('b1', ['1']), 'b': element('b0', ['1'])}, bulk=True)
+        self.assertFalse(ImageResult.objects.filter(id='b1').exists())
+
+
+class RemapIdsTests(DeviceCacheResetMixin, APITestCase):
+    url = ELEMENTS_URL + 'remap-ids/'
+
+    def setUp(self):
+        super().setUp()
+        ImageResultService.create_from_payload({
+            key: element(key, ['1 2 3']) for key in ('r1', 'r2', 'r3')
+        })
+
+    def assert_ids(self, ids):
+        self.assertEqual(set(ImageResult.objects.values_list('id', flat=True)), set(ids))
+
+    def test_remaps_ids(self):
+        response = self.client.post(self.url, {'mapping': {'r1': 'n1', 'r2': 'n2'}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'updated': 2})
+        self.assert_ids({'n1', 'n2', 'r3'})
+
+    def test_single_collision(self):
+        response = self.client.post(self.url, {'mapping': {'r1': 'r3'}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'error': ['ImageResult with id r3 already exists.']})
+        self.assert_ids({'r1', 'r2', 'r3'})
+
+    def test_many_collisions(self):
+        ImageResultService.create_from_payload({'x': element('r4', ['1'])})
+        response = self.client.post(self.url, {'mapping': {'r1': 'r4', 'r2': 'r3'}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'error': {'collisions': ['r3', 'r4']}})
+        self.assert_ids({'r1', 'r2', 'r3', 'r4'})
+
+    def test_missing_ids(self):
+        response = self.client.post(
+            self.url, {'mapping': {'r1': 'n1', 'z2': 'n2', 'z1': 'n3'}}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'error': {'missing': ['z1', 'z2']}})
+        self.assert_ids({'r1', 'r2', 'r3'})
+
+    def test_collision_reported_before_missing(self):
+        response = self.client.post(self.url, {'mapping': {'r1': 'r3', 'z1': 'n1'}}, format='json')
+        self.assertEqual(response.json(), {'error': ['ImageResult with id r3 already exists.']})
+
+    def test_duplicate_new_ids(self):
+        response = self.client.post(self.url, {'mapping': {'r1': 'n1', 'r2': 'n1'}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'error': ['New ids must be unique.']})
+
+    def test_chained_ids(self):
+        response = self.client.post(self.url, {'mapping': {'r1': 'n1', 'n1': 'n2'}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assert_ids({'r1', 'r2', 'r3'})
+
+
+class BulkSelectionTests(DeviceCacheResetMixin, APITestCase):
+    url = ELEMENTS_URL + 'bulk/'
+
+    def setUp(self):
+        super().setUp()
+        ImageResultService.create_from_payload({
+            key: element(key, ['1 2 3']) for key in ('k1', 'k2', 'k3')
+        })
+
+    def test_blank_filter_does_not_delete(self):
+        response = self.client.delete(self.url, {'filter': {'data_size_min': ''}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('filter', response.json())
+        self.assertEqual(ImageResult.objects.count(), 3)
+
+    def test_blank_filter_does_not_update(self):
+        response = self.client.patch(
+            self.url, {'filter': {'device_name': '', 'created_date_after': ''}, 'device_name': 'MR'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ImageResult.objects.filter(device__device_name='MR').exists())
+
+    def test_filter_with_value(self):
+        ImageResultService.create_from_payload({'x': element('k4', ['1'], 'MR')})
+        response = self.client.delete(self.url, {'filter': {'device_name': 'MR'}}, format='json')
+        self.assertEqual(response.json(), {'deleted': 1})
+        self.assertEqual(ImageResult.objects.count(), 3)
+
+
+class ParseRowsTests(SimpleTestCase):
+    def test_blank_rows_are_empty(self):
+        for rows in ([' '], ['\t', '\n'], ['', '  ']):
+            self.assertEqual(processing.parse_rows(rows).size, 0, rows)
+
+    def test_blank_rows_between_values(self):
+        self.assertEqual(processing.parse_rows(['1 2', ' ', '3\t4']).tolist(), [1, 2, 3, 4])
+
+    def test_blank_data_is_rejected(self):
+        serializer = InputDataSerializer(data=element('e1', [' ']))
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('data', serializer.errors)
+
+
+class DescribeTests(SimpleTestCase):
+    """``processing.describe`` coincide con NumPy en una sola pasada por bloques"""
+
+    def assert_matches_numpy(self, samples):
+        result = processing.describe(samples)
+        stats = result['statistics']
+        self.assertAlmostEqual(result['average_before_normalization'], samples.mean())
+        self.assertEqual(result['data_size'], samples.size)
+        self.assertEqual((stats['min'], stats['max']), (samples.min(), samples.max()))
+        self.assertAlmostEqual(stats['std'], samples.std(), places=6)
+        return stats
+
+    def test_small_array(self):
+        samples = np.random.default_rng(0).integers(-100, 4096, 1000)
+        stats = self.assert_matches_numpy(samples)
+        expected = np.percentile(samples, (25, 50, 75))
+        self.assertEqual(list(stats['percentiles'].values()), list(expected))
+        self.assertFalse(stats['percentiles_approximate'])
+
+    def test_array_spanning_blocks(self):
+        samples = np.random.default_rng(1).integers(0, 4096, 300_000)
+        stats = self.assert_matches_numpy(samples)
+        self.assertTrue(stats['percentiles_approximate'])
+        for percentile, value in zip((25, 50, 75), np.percentile(samples, (25, 50, 75))):
+            self.assertAlmostEqual(stats['percentiles'][str(percentile)], value, delta=4096 * 0.01)
+
+
+# Caché de respuestas propia de cada prueba: la compartida en disco sobrevive a la base de datos de pruebas
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class StatisticsFieldTests(DeviceCacheResetMixin, APITestCase):
+    def test_statistics_are_stored_and_returned(self):
+        ImageResultService.create_from_payload({'a': element('s1', ['1 2 3', '4 5'])})
+        statistics = self.client.get(ELEMENTS_URL + 's1/').json()['statistics']
+        self.assertEqual(statistics['min'], 1)
+        self.assertEqual(statistics['max'], 5)
+        self.assertEqual(statistics['percentiles'], {'25': 2.0, '50': 3.0, '75': 4.0})
+
+
+class IngestionJobListTests(APITestCase):
+    url = '/api/jobs/'
+
+    def setUp(self):
+        super().setUp()
+        self.jobs = [
+            IngestionJob.objects.create(payload={'a': {}}, total=1, processed=1, results={'a': {'status': 'created'}})
+            for _ in range(3)
+        ]
+
+    def test_list_is_paginated_without_results(self):
+        # Una sola consulta: los campos diferidos no se cargan por fila
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(len(body['results']), 2)
+        for job in body['results']:
+            self.assertNotIn('results', job)
+            self.assertNotIn('payload', job)
+
+        seen = [job['id'] for job in body['results']]
+        body = self.client.get(body['next']).json()
+        seen += [job['id'] for job in body['results']]
+        self.assertIsNone(body['next'])
+        self.assertEqual(sorted(seen), sorted(str(job.id) for job in self.jobs))
+
+    def test_detail_includes_results(self):
+        response = self.client.get(f'{self.url}{self.jobs[0].id}/')
+        self.assertEqual(response.json()['results'], {'a': {'status': 'created'}})
+        self.assertNotIn('payload', response.json())
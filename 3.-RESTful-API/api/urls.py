@@ -1,10 +1,14 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ImageViewSet
+from . import async_views
+from .views import ImageViewSet, IngestionJobViewSet
 
 router = DefaultRouter()
 router.register(r'elements', ImageViewSet)
+router.register(r'jobs', IngestionJobViewSet)
 
 urlpatterns = [
+    path('async/elements/', async_views.elements, name='async-elements'),
+    path('async/elements/<str:pk>/', async_views.element_detail, name='async-element-detail'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
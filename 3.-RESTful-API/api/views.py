@@ -1,26 +1,322 @@
-from django.db import transaction
+import copy
+import logging
+
+from django.conf import settings
+from django.db.models import Avg, Count, F, Max, Min, Sum
+from django.db.models.functions import Trunc
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
 from rest_framework import viewsets, status, serializers
+from rest_framework.decorators import action
 from rest_framework.response import Response
-from .models import Device, ImageResult
-from .serializers import ImageResultSerializer, InputDataSerializer
+from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings
+from . import jobs, metrics, raw_store, response_cache
+from .models import Device, ImageResult, IngestionJob
+from .serializers import (
+    BulkSelectionSerializer, BulkUpdateSerializer, IdMappingSerializer, ImageResultSerializer,
+    IngestionJobListSerializer, IngestionJobSerializer, InputDataSerializer
+)
+from .device_cache import device_cache, run_atomic
 from .filters import ImageResultFilter
+from .pagination import KeysetPagination
+from .parsers import BinaryPayloadParser
 from .services import ImageResultService
 from django_filters.rest_framework import DjangoFilterBackend
 
-class ImageViewSet(viewsets.ModelViewSet):
+logger = logging.getLogger(__name__)
+
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+class ImageViewSet(response_cache.CachedResponseMixin, viewsets.ModelViewSet):
     queryset = ImageResult.objects.all()
     serializer_class = ImageResultSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_class = ImageResultFilter
+    pagination_class = KeysetPagination
+    # Además de JSON, acepta el formato binario de ingesta (application/vnd.medical-api.samples)
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, BinaryPayloadParser]
+    fields_query_param = 'fields'
+    create_modes = ('upsert', 'partial')
+    include_query_param = 'include'
+    includable = ('raw_data',)
+    stats_buckets = ('hour', 'day', 'week', 'month', 'year')
+
+    def get_list_fields(self, request):
+        """Campos solicitados con ``?fields=``, en el orden del serializador"""
+        return ImageResultSerializer.select_fields(request.query_params.get(self.fields_query_param))
+
+    def get_includes(self, request):
+        """Datos adicionales pedidos con ``?include=`` (se cargan solo si se piden)"""
+        requested = {
+            value.strip()
+            for value in request.query_params.get(self.include_query_param, '').split(',')
+            if value.strip()
+        }
+        unknown = requested.difference(self.includable)
+        if unknown:
+            raise serializers.ValidationError(
+                {"include": f"Unknown include values: {', '.join(sorted(unknown))}."}
+            )
+        return requested
+
+    @staticmethod
+    def load_raw_data(key):
+        """Muestras originales guardadas para un resultado, o None si no se guardaron"""
+        if key is None:
+            return None
+        try:
+            return raw_store.load(key).tolist()
+        except FileNotFoundError:
+            logger.warning(f"Raw data file not found: {key}")
+            return None
+
+    def list(self, request, *args, **kwargs):
+        # Las muestras originales no se guardan en caché: la caché se limita por
+        # número de entradas, no por tamaño, y cada página puede ocupar cientos de MB
+        if 'raw_data' in self.get_includes(request):
+            return self.build_list_response(request)
+        return self.cached_response(
+            request,
+            response_cache.list_key(request),
+            lambda: self.build_list_response(request)
+        )
+
+    def build_list_response(self, request):
+        fields = self.get_list_fields(request)
+
+        # .values() evita instanciar modelos y serializadores por fila; los campos
+        # del cursor se leen siempre aunque no se devuelvan
+        query_fields = set(fields).union(KeysetPagination.ordering)
+        include_raw_data = 'raw_data' in self.get_includes(request)
+        if include_raw_data:
+            query_fields.add('raw_data_key')
+        queryset = self.filter_queryset(self.get_queryset()).values(*query_fields)
+
+        page = self.paginate_queryset(queryset)
+        data = [{field: row[field] for field in fields} for row in page]
+        if include_raw_data:
+            for item, row in zip(data, page):
+                item['raw_data'] = self.load_raw_data(row['raw_data_key'])
+        return self.get_paginated_response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        if 'raw_data' in self.get_includes(request):
+            instance = self.get_object()
+            data = self.get_serializer(instance).data
+            data['raw_data'] = self.load_raw_data(instance.raw_data_key)
+            return Response(data)
+
+        build_response = lambda: super(ImageViewSet, self).retrieve(request, *args, **kwargs)
+        if request.query_params:
+            return build_response()
+        return self.cached_response(
+            request, response_cache.detail_key(kwargs[self.lookup_field]), build_response
+        )
+
+    @action(detail=False, methods=['get'], url_path='stats')
+    def stats(self, request, *args, **kwargs):
+        """Estadísticas agregadas por dispositivo e intervalo de tiempo calculadas en la base de datos"""
+        return self.cached_response(
+            request,
+            response_cache.list_key(request, namespace='stats'),
+            lambda: self.build_stats_response(request),
+            timeout=settings.STATS_CACHE_SECONDS
+        )
+
+    def build_stats_response(self, request):
+        bucket = request.query_params.get('bucket', 'day')
+        if bucket not in self.stats_buckets:
+            return Response(
+                {"error": f"bucket must be one of: {', '.join(self.stats_buckets)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = (
+            queryset
+            .annotate(bucket=Trunc('created_date', bucket))
+            .values('device', 'bucket', device_name=F('device__device_name'))
+            .annotate(
+                count=Count('id'),
+                avg_before_normalization=Avg('average_before_normalization'),
+                min_before_normalization=Min('average_before_normalization'),
+                max_before_normalization=Max('average_before_normalization'),
+                total_data_size=Sum('data_size'),
+            )
+            .order_by('device', 'bucket')
+        )
+        response = Response({"bucket": bucket, "results": list(rows)})
+        patch_cache_control(response, max_age=settings.STATS_CACHE_SECONDS)
+        return response
+
+    @action(detail=False, methods=['get'], url_path='cache-stats')
+    def cache_stats(self, request, *args, **kwargs):
+        """Contadores de aciertos y fallos de las cachés de respuestas y de dispositivos"""
+        return Response({
+            "responses": response_cache.get_stats(),
+            "devices": device_cache.get_stats(),
+        })
 
     def create(self, request, *args, **kwargs):
+        if request.query_params.get('async', '').lower() in ('1', 'true'):
+            return self.create_async(request)
+        mode = request.query_params.get('mode')
+        if mode is not None and mode not in self.create_modes:
+            return Response(
+                {"error": f"mode must be one of: {', '.join(self.create_modes)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if mode == 'upsert':
+            return self.create_upsert(request)
+        if mode == 'partial':
+            return self.create_partial(request)
+
+        try:
+            # El cuerpo se parsea de forma perezosa al acceder a request.data
+            with metrics.stage('parse'):
+                payload = request.data
+            serialized_results = run_atomic(lambda: [
+                self.get_serializer(result).data
+                for result in ImageResultService.create_from_payload(payload)
+            ])
+            return Response(serialized_results, status=status.HTTP_201_CREATED)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def create_upsert(self, request):
+        """Ingesta idempotente: responde el estado de cada elemento (created, unchanged o conflict)"""
+        try:
+            with metrics.stage('parse'):
+                payload = request.data
+            results = run_atomic(lambda: ImageResultService.upsert_from_payload(payload))
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        counts = {status_name: 0 for status_name in ('created', 'unchanged', 'conflict')}
+        for result in results.values():
+            counts[result['status']] += 1
+        response_status = status.HTTP_201_CREATED if counts['created'] else status.HTTP_200_OK
+        return Response({**counts, "results": results}, status=response_status)
+
+    def create_partial(self, request):
+        """Inserta los elementos válidos y responde el resultado de cada clave (207 si es mixto)"""
+        try:
+            with metrics.stage('parse'):
+                payload = request.data
+            if not isinstance(payload, dict):
+                raise ValueError("Payload must be a JSON object.")
+            results = run_atomic(lambda: ImageResultService.partial_create_from_payload(payload))
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        created = sum(1 for result in results.values() if result['status'] == 'created')
+        failed = len(results) - created
+        if not failed:
+            response_status = status.HTTP_201_CREATED
+        elif not created:
+            response_status = status.HTTP_400_BAD_REQUEST
+        else:
+            response_status = status.HTTP_207_MULTI_STATUS
+        return Response(
+            {"created": created, "failed": failed, "results": results},
+            status=response_status
+        )
+
+    def create_async(self, request):
+        """Encola el lote como trabajo de ingesta y responde 202 sin esperar al procesamiento"""
+        if request.content_type.startswith(BinaryPayloadParser.media_type):
+            # El trabajo guarda el lote en un JSONField, que no admite arrays binarios
+            return Response(
+                {"error": "Binary payloads are not supported for async ingestion."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not isinstance(request.data, dict):
+            return Response(
+                {"error": "Payload must be a JSON object."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        job = jobs.submit_job(request.data)
+        return Response(
+            {
+                "job_id": str(job.id),
+                "status": job.status,
+                "status_url": reverse('ingestionjob-detail', args=[job.id], request=request),
+            },
+            status=status.HTTP_202_ACCEPTED
+        )
+
+    @action(detail=False, methods=['post'], url_path='stream')
+    def stream(self, request, *args, **kwargs):
+        """Ingesta por streaming: procesa el cuerpo JSON por bloques sin cargarlo completo"""
+        try:
+            chunk_size = int(request.query_params.get('chunk_size', settings.INGEST_CHUNK_SIZE))
+            if chunk_size <= 0:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": "chunk_size must be a positive integer."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        chunks = []
+        try:
+            for progress in ImageResultService.ingest_stream(request.stream, chunk_size):
+                logger.info(f"Stream chunk: {progress}")
+                chunks.append(progress)
+        except Exception as e:
+            # Los bloques anteriores ya están confirmados
+            return Response({"error": str(e), "chunks": chunks}, status=status.HTTP_400_BAD_REQUEST)
+
+        processed = chunks[-1]['processed'] if chunks else 0
+        return Response({"processed": processed, "chunks": chunks}, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['post'], url_path='remap-ids')
+    def remap_ids(self, request, *args, **kwargs):
+        """Renombra ids en bloque a partir de un mapeo {anterior: nuevo}"""
+        serializer = IdMappingSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
         try:
-            with transaction.atomic():
-                results = ImageResultService.create_from_payload(request.data)
-                serialized_results = [
-                    self.get_serializer(result).data for result in results
-                ]
-                return Response(serialized_results, status=status.HTTP_201_CREATED)
+            updated = ImageResultService.remap_ids(serializer.validated_data['mapping'])
+        except serializers.ValidationError as e:
+            return Response({"error": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"updated": updated})
+
+    @action(detail=False, methods=['patch', 'delete'], url_path='bulk')
+    def bulk(self, request, *args, **kwargs):
+        """Actualiza o elimina en bloque los resultados seleccionados por ids o por filtro"""
+        serializer_class = BulkUpdateSerializer if request.method == 'PATCH' else BulkSelectionSerializer
+        serializer = serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        selection = serializer.validated_data
+
+        # Con ids se invalida la caché solo para esos registros; con filtro, todos
+        ids = selection.get('ids')
+        if ids is not None:
+            queryset = ImageResult.objects.filter(id__in=ids)
+        else:
+            filterset = ImageResultFilter(selection['filter'], queryset=self.get_queryset())
+            if not filterset.is_valid():
+                return Response({"filter": filterset.errors}, status=status.HTTP_400_BAD_REQUEST)
+            # Un filtro con todos los valores vacíos no aplica ninguna condición: seleccionaría todo
+            if all(value in (None, '', [], ()) for value in filterset.form.cleaned_data.values()):
+                return Response(
+                    {"filter": ["Filter must set at least one non-empty condition."]},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            queryset = filterset.qs
+
+        try:
+            if request.method == 'PATCH':
+                updated = ImageResultService.bulk_update_device(
+                    queryset, selection['device_name'], ids=ids
+                )
+                return Response({"updated": updated})
+            deleted = ImageResultService.bulk_delete(queryset, ids=ids)
+            return Response({"deleted": deleted})
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -29,24 +325,27 @@ class ImageViewSet(viewsets.ModelViewSet):
         new_id = request.data.get('id')
         device_name = request.data.get('device_name')
 
+        def apply(instance):
+            # Cambiar ID si es necesario
+            if new_id and new_id != instance.id:
+                instance = ImageResultService.change_id(instance, new_id)
+            
+            # Actualizar dispositivo si se proporciona
+            if device_name:
+                instance.actualizar_dispositivo(device_name)
+            
+            # Actualizar otros campos
+            serializer = self.get_serializer(instance, data=request.data, partial=False)
+            if serializer.is_valid():
+                serializer.save()
+                response_cache.invalidate_elements([instance.pk])
+                return Response(serializer.data)
+            else:
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
         try:
-            with transaction.atomic():
-                # Cambiar ID si es necesario
-                if new_id and new_id != instance.id:
-                    instance = ImageResultService.change_id(instance, new_id)
-                
-                # Actualizar dispositivo si se proporciona
-                if device_name:
-                    instance.actualizar_dispositivo(device_name)
-                
-                # Actualizar otros campos
-                serializer = self.get_serializer(instance, data=request.data, partial=False)
-                if serializer.is_valid():
-                    serializer.save()
-                    return Response(serializer.data)
-                else:
-                    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-                    
+            # Cada intento trabaja sobre una copia: un reintento parte del registro original
+            return run_atomic(lambda: apply(copy.copy(instance)))
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -55,17 +354,47 @@ class ImageViewSet(viewsets.ModelViewSet):
         new_id = request.data.get('id')
         device_name = request.data.get('device_name')
 
+        def apply(instance):
+            # Cambiar ID si es necesario
+            if new_id and new_id != instance.id:
+                instance = ImageResultService.change_id(instance, new_id)
+            
+            # Actualizar dispositivo si se proporciona
+            if device_name:
+                instance.actualizar_dispositivo(device_name)
+            
+            return Response(self.get_serializer(instance).data)
+        
         try:
-            with transaction.atomic():
-                # Cambiar ID si es necesario
-                if new_id and new_id != instance.id:
-                    instance = ImageResultService.change_id(instance, new_id)
-                
-                # Actualizar dispositivo si se proporciona
-                if device_name:
-                    instance.actualizar_dispositivo(device_name)
-                
-                return Response(self.get_serializer(instance).data)
-                
+            # Cada intento trabaja sobre una copia: un reintento parte del registro original
+            return run_atomic(lambda: apply(copy.copy(instance)))
         except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def perform_destroy(self, instance):
+        pk = instance.pk
+        instance.delete()
+        response_cache.invalidate_elements([pk])
+
+
+def metrics_view(request):
+    """Métricas del proceso en formato de texto de Prometheus"""
+    return HttpResponse(metrics.registry.render(), content_type=METRICS_CONTENT_TYPE)
+
+
+class IngestionJobViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = IngestionJob.objects.all()
+    serializer_class = IngestionJobSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # El lote y los resultados pueden ocupar megabytes por trabajo
+            queryset = queryset.defer('payload', 'results')
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return IngestionJobListSerializer
+        return super().get_serializer_class()
@@ -0,0 +1,35 @@
+"""Utilidades compartidas por los benchmarks que necesitan Django y base de datos."""
+import os
+import sys
+from contextlib import contextmanager
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup_django(default_settings='medical_api.settings'):
+    """Configura Django usando ``DJANGO_SETTINGS_MODULE`` (por defecto ``default_settings``).
+
+    Los benchmarks que no usan la base de datos pasan ``benchmarks.settings_sqlite``
+    para poder ejecutarse sin el driver de PostgreSQL instalado.
+    """
+    if PROJECT_DIR not in sys.path:
+        sys.path.insert(0, PROJECT_DIR)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', default_settings)
+
+    import django
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """Crea una base de datos de pruebas temporal y la elimina al terminar"""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
@@ -0,0 +1,158 @@
+"""
+Prueba de carga local bajo ASGI: vistas síncronas (DRF) frente a vistas asíncronas.
+
+Arranca ``uvicorn`` con ``medical_api.asgi`` sobre una base SQLite temporal (o la
+base configurada en ``DJANGO_SETTINGS_MODULE``), carga datos de ejemplo y mide
+rendimiento (peticiones/s) y latencias p50/p99 de listado y detalle.
+
+Requiere ``pip install uvicorn``.
+
+Uso:
+    python benchmarks/bench_asgi.py [--requests 500] [--concurrency 16]
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = (
+    ('listado', '/api/elements/?page_size=50', '/api/async/elements/?page_size=50'),
+    ('detalle', '/api/elements/bench-0/', '/api/async/elements/bench-0/'),
+)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("El servidor ASGI no arrancó a tiempo")
+
+
+def seed(port, elements):
+    """Crea ``elements`` resultados a través de la propia API"""
+    row = ' '.join(str(i % 255 + 1) for i in range(256))
+    payload = {
+        str(i): {'id': f'bench-{i}', 'data': [row], 'deviceName': f'Scanner {i % 4}'}
+        for i in range(elements)
+    }
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    connection.request(
+        'POST', '/api/elements/', body=json.dumps(payload),
+        headers={'Content-Type': 'application/json'}
+    )
+    response = connection.getresponse()
+    response.read()
+    if response.status != 201:
+        raise RuntimeError(f"No se pudieron crear los datos de prueba: {response.status}")
+
+
+def load(port, path, total_requests, concurrency):
+    """Lanza ``total_requests`` GET repartidos en ``concurrency`` conexiones persistentes"""
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    per_worker = total_requests // concurrency
+
+    def worker():
+        nonlocal errors
+        connection = http.client.HTTPConnection('127.0.0.1', port)
+        local = []
+        local_errors = 0
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            connection.request('GET', path)
+            response = connection.getresponse()
+            response.read()
+            local.append(time.perf_counter() - start)
+            local_errors += response.status != 200
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'rps': len(latencies) / elapsed,
+        'p50': latencies[len(latencies) // 2] * 1000,
+        'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--elements', type=int, default=1000)
+    args = parser.parse_args()
+
+    try:
+        import uvicorn  # noqa: F401
+    except ImportError:
+        sys.exit("Este benchmark requiere uvicorn: pip install uvicorn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings_sqlite')
+        env.setdefault('BENCHMARK_SQLITE_PATH', os.path.join(tmp, 'asgi.sqlite3'))
+        # Sin caché de respuestas para comparar el trabajo real de cada vista
+        env.setdefault('BENCHMARK_NO_CACHE', '1')
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [PROJECT_DIR, env.get('PYTHONPATH')]))
+
+        subprocess.run(
+            [sys.executable, 'manage.py', 'migrate', '--verbosity', '0'],
+            cwd=PROJECT_DIR, env=env, check=True
+        )
+
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'uvicorn', 'medical_api.asgi:application',
+             '--port', str(port), '--log-level', 'warning', '--no-access-log'],
+            cwd=PROJECT_DIR, env=env
+        )
+        try:
+            wait_until_ready(port)
+            seed(port, args.elements)
+
+            print(f"{'escenario':<10} {'vista':<6} {'req/s':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} {'errores':>8}")
+            for label, sync_path, async_path in SCENARIOS:
+                for kind, path in (('sync', sync_path), ('async', async_path)):
+                    load(port, path, args.concurrency * 2, args.concurrency)  # calentamiento
+                    result = load(port, path, args.requests, args.concurrency)
+                    print(
+                        f"{label:<10} {kind:<6} {result['rps']:>8.0f} {result['p50']:>9.2f} "
+                        f"{result['p99']:>9.2f} {result['errors']:>8}"
+                    )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Formato JSON frente al formato binario de ingesta (``application/vnd.medical-api.samples``).
+
+Genera un lote con el formato de ``samples/sample-03-json.json`` (filas de
+números separados por espacios) y el mismo lote codificado en binario, y
+compara bytes transmitidos y tiempo de parseo + validación con
+``InputDataSerializer`` (hasta obtener el array de NumPy de cada elemento).
+
+Uso:
+    python benchmarks/bench_binary_payload.py [--elements 50] [--samples 262144] [--max-value 4095]
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._django import setup_django  # noqa: E402
+
+
+def build_payload(elements, samples, max_value, row_length=512):
+    rng = np.random.default_rng(0)
+    payload = {}
+    for i in range(elements):
+        values = rng.integers(1, max_value + 1, size=samples)
+        payload[str(i)] = {
+            'id': f'bench-{i}',
+            'deviceName': f'Scanner {i % 4}',
+            'data': values,
+        }
+    as_json = {
+        key: {
+            'id': element['id'],
+            'deviceName': element['deviceName'],
+            'data': [
+                ' '.join(map(str, row))
+                for row in np.array_split(element['data'], max(1, samples // row_length))
+            ],
+        }
+        for key, element in payload.items()
+    }
+    return payload, as_json
+
+
+def best_of(function, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--elements', type=int, default=50)
+    parser.add_argument('--samples', type=int, default=262144)
+    parser.add_argument('--max-value', type=int, default=4095)
+    args = parser.parse_args()
+
+    # Solo parsea y valida: no necesita PostgreSQL
+    setup_django('benchmarks.settings_sqlite')
+    from rest_framework.parsers import JSONParser
+
+    from api.parsers import BinaryPayloadParser, encode_payload
+    from api.serializers import InputDataSerializer
+
+    payload, as_json = build_payload(args.elements, args.samples, args.max_value)
+    json_body = json.dumps(as_json).encode()
+    binary_body = encode_payload(payload)
+
+    def validate(parsed):
+        for element in parsed.values():
+            serializer = InputDataSerializer(data=element)
+            serializer.is_valid(raise_exception=True)
+
+    def parse_json():
+        validate(JSONParser().parse(io.BytesIO(json_body)))
+
+    def parse_binary():
+        validate(BinaryPayloadParser().parse(io.BytesIO(binary_body)))
+
+    json_time = best_of(parse_json)
+    binary_time = best_of(parse_binary)
+
+    print(f"Elementos: {args.elements} x {args.samples} muestras (máx. {args.max_value})")
+    print(f"{'formato':>8} {'bytes':>14} {'parseo (s)':>11} {'MB/s':>8}")
+    for name, body, seconds in (('json', json_body, json_time), ('binario', binary_body, binary_time)):
+        print(f"{name:>8} {len(body):>14,} {seconds:>11.3f} {len(body) / seconds / 1e6:>8.1f}")
+    print(f"Reducción de tamaño: {len(json_body) / len(binary_body):.1f}x, "
+          f"aceleración del parseo: {json_time / binary_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
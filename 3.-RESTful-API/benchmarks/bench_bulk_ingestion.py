@@ -0,0 +1,87 @@
+"""
+Benchmark de ingesta: modo por elemento frente al modo en bloque de ``create_from_payload``.
+
+Registra el número de consultas y el tiempo total para un lote de N elementos.
+El modo parcial (``partial_create_from_payload``) se mide con un porcentaje
+de elementos inválidos mezclados en el lote (``--invalid``).
+
+Uso:
+    python benchmarks/bench_bulk_ingestion.py [--elements 10000] [--samples 64] [--invalid 1]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._django import setup_django, test_database  # noqa: E402
+
+DEVICE_NAMES = ('CT SCAN', 'MRI Scanner', 'RX Scanner', 'PET Scanner')
+
+
+def build_payload(prefix, elements, samples, invalid_every=0):
+    """Genera un lote con el formato del endpoint ``/elements/``"""
+    row = ' '.join(str(i % 255 + 1) for i in range(samples))
+    payload = {
+        str(i): {
+            'id': f'{prefix}-{i}',
+            'data': [row],
+            'deviceName': DEVICE_NAMES[i % len(DEVICE_NAMES)],
+        }
+        for i in range(elements)
+    }
+    if invalid_every:
+        for i in range(0, elements, invalid_every):
+            payload[str(i)]['data'] = [row + ' x']
+    return payload
+
+
+def run(payload, create):
+    """Ejecuta la ingesta dentro de una transacción y devuelve (consultas, segundos)"""
+    from django.db import connection, transaction
+
+    num_queries = 0
+
+    def count_queries(execute, sql, params, many, context):
+        nonlocal num_queries
+        num_queries += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_queries):
+        start = time.perf_counter()
+        with transaction.atomic():
+            results = create(payload)
+        elapsed = time.perf_counter() - start
+    assert len(results) == len(payload)
+    return num_queries, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--elements', type=int, default=10_000)
+    parser.add_argument('--samples', type=int, default=64)
+    parser.add_argument('--invalid', type=float, default=1.0, help="Porcentaje de elementos inválidos en el modo parcial")
+    args = parser.parse_args()
+
+    setup_django()
+    from api.services import ImageResultService
+
+    invalid_every = int(100 / args.invalid) if args.invalid > 0 else 0
+    modes = (
+        ('por elemento', lambda payload: ImageResultService.create_from_payload(payload, bulk=False), 0),
+        ('en bloque', ImageResultService.create_from_payload, 0),
+        ('parcial', ImageResultService.partial_create_from_payload, invalid_every),
+    )
+    with test_database():
+        print(f"{'modo':>14} {'consultas':>10} {'tiempo (s)':>11} {'elementos/s':>12}")
+        for label, create, invalid in modes:
+            payload = build_payload(label.replace(' ', '-'), args.elements, args.samples, invalid)
+            num_queries, elapsed = run(payload, create)
+            print(f"{label:>14} {num_queries:>10} {elapsed:>11.3f} {args.elements / elapsed:>12.0f}")
+        if invalid_every:
+            print(f"El modo parcial incluye un {args.invalid:g} % de elementos inválidos")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark de los filtros de ``ImageResultFilter``: carga N filas, ejecuta cada filtro
+y verifica con EXPLAIN que la consulta usa el índice esperado.
+
+Uso:
+    python benchmarks/bench_filter_indexes.py [--rows 100000]
+
+Termina con código 1 si algún filtro no usa su índice.
+"""
+import argparse
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._django import setup_django, test_database  # noqa: E402
+
+DEVICES = 20
+
+
+@contextmanager
+def manual_timestamps(model):
+    """Desactiva temporalmente auto_now/auto_now_add para cargar fechas repartidas"""
+    created = model._meta.get_field('created_date')
+    updated = model._meta.get_field('updated_date')
+    created.auto_now_add, updated.auto_now = False, False
+    try:
+        yield
+    finally:
+        created.auto_now_add, updated.auto_now = True, True
+
+
+def load_rows(rows):
+    """Inserta ``rows`` resultados repartidos entre dispositivos y un año de fechas"""
+    from django.utils import timezone
+    from api.models import Device, ImageResult
+
+    devices = Device.objects.bulk_create(
+        [Device(device_name=f'Scanner {i}') for i in range(DEVICES)]
+    )
+    start = timezone.now() - timedelta(days=365)
+    step = timedelta(days=365) / rows
+    with manual_timestamps(ImageResult):
+        ImageResult.objects.bulk_create(
+            (
+                ImageResult(
+                    id=f'result-{i:08d}',
+                    device=devices[i % DEVICES],
+                    average_before_normalization=(i * 7919) % rows,
+                    average_after_normalization=((i * 104729) % rows) / rows,
+                    data_size=(i * 15485863) % rows,
+                    created_date=start + step * i,
+                    updated_date=start + step * i + timedelta(hours=1),
+                )
+                for i in range(rows)
+            ),
+            batch_size=5000,
+        )
+    return start, devices
+
+
+def filter_cases(rows, start, devices):
+    """Parámetros de cada filtro (≈1 % de las filas) y el índice que debe usar"""
+    window = timedelta(days=365) / 100
+    device = devices[0].pk
+    return [
+        ('created_date', {
+            'created_date_after': start + window * 40,
+            'created_date_before': start + window * 41,
+        }, 'api_ir_created_id_idx'),
+        ('updated_date', {
+            'updated_date_after': start + window * 40,
+            'updated_date_before': start + window * 41,
+        }, 'api_ir_updated_idx'),
+        ('average_before_normalization', {
+            'average_before_normalization_min': rows * 0.40,
+            'average_before_normalization_max': rows * 0.41,
+        }, 'api_ir_avg_before_idx'),
+        ('average_after_normalization', {
+            'average_after_normalization_min': 0.40,
+            'average_after_normalization_max': 0.41,
+        }, 'api_ir_avg_after_idx'),
+        ('data_size', {
+            'data_size_min': int(rows * 0.40),
+            'data_size_max': int(rows * 0.41),
+        }, 'api_ir_data_size_idx'),
+        ('device + created_date', {
+            'device': device,
+            'created_date_after': start + window * 40,
+            'created_date_before': start + window * 50,
+        }, 'api_ir_device_created_idx'),
+        ('device + updated_date', {
+            'device': device,
+            'updated_date_after': start + window * 40,
+            'updated_date_before': start + window * 50,
+        }, 'api_ir_device_updated_idx'),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database() as connection:
+        from api.filters import ImageResultFilter
+        from api.models import ImageResult
+
+        start_load = time.perf_counter()
+        start, devices = load_rows(args.rows)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        print(f"{args.rows} filas cargadas en {time.perf_counter() - start_load:.1f} s ({connection.vendor})\n")
+
+        failures = 0
+        print(f"{'filtro':<30} {'filas':>7} {'ms':>8}  índice")
+        for label, params, index_name in filter_cases(args.rows, start, devices):
+            filterset = ImageResultFilter(
+                {key: str(value) for key, value in params.items()},
+                queryset=ImageResult.objects.all()
+            )
+            assert filterset.is_valid(), filterset.errors
+            queryset = filterset.qs
+
+            plan = queryset.explain()
+            t0 = time.perf_counter()
+            count = len(queryset.values_list('id', flat=True))
+            elapsed = (time.perf_counter() - t0) * 1000
+
+            used = index_name in plan
+            failures += not used
+            print(f"{label:<30} {count:>7} {elapsed:>8.2f}  {'OK  ' if used else 'FALLO'} {index_name}")
+            if not used:
+                print('    ' + plan.replace('\n', '\n    '))
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Sobrecarga por petición de ``LoggingMiddleware``.
+
+Compara el middleware original (f-string + ``logging.FileHandler`` síncrono)
+con el actual (``QueueFileHandler`` en JSON lines) y con muestreo
+del 10 %. La vista es trivial para que solo se mida el coste del registro.
+
+``--disk-latency-us`` añade una espera a cada escritura en disco para simular
+un volumen lento o compartido, que es donde el ``FileHandler`` síncrono
+bloquea la petición.
+
+Uso:
+    python benchmarks/bench_logging_middleware.py [--requests 20000] [--disk-latency-us 0]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._django import setup_django  # noqa: E402
+
+
+class LegacyLoggingMiddleware:
+    """Réplica del middleware anterior: dos f-strings y escritura síncrona"""
+
+    def __init__(self, get_response, logger):
+        self.get_response = get_response
+        self.logger = logger
+
+    def __call__(self, request):
+        start_time = time.time()
+        log_data = {
+            'path': request.path,
+            'method': request.method,
+            'user': request.user.username if request.user.is_authenticated else 'AnonymousUser',
+        }
+        self.logger.info(f"Request: {log_data}")
+        response = self.get_response(request)
+        log_data['status_code'] = response.status_code
+        log_data['duration'] = time.time() - start_time
+        self.logger.info(f"Response: {log_data}")
+        return response
+
+
+def configure_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def simulate_disk_latency(latency_us):
+    """Retrasa cada escritura de ``FileHandler`` (también la de ``RotatingFileHandler``)"""
+    emit = logging.FileHandler.emit
+
+    def slow_emit(self, record):
+        time.sleep(latency_us / 1e6)
+        emit(self, record)
+
+    logging.FileHandler.emit = slow_emit
+
+
+def measure(middleware, requests):
+    start = time.perf_counter()
+    for request in requests:
+        middleware(request)
+    return (time.perf_counter() - start) / len(requests) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--disk-latency-us', type=int, default=0)
+    args = parser.parse_args()
+    if args.disk_latency_us:
+        simulate_disk_latency(args.disk_latency_us)
+
+    # No usa la base de datos: no necesita PostgreSQL
+    setup_django('benchmarks.settings_sqlite')
+    from django.contrib.auth.models import AnonymousUser
+    from django.http import HttpResponse
+    from django.test import RequestFactory, override_settings
+
+    from api import middleware as middleware_module
+    from api.logging_utils import QueueFileHandler
+
+    factory = RequestFactory()
+    requests = []
+    for i in range(args.requests):
+        request = factory.get(f'/api/elements/bench-{i % 100}/')
+        request.user = AnonymousUser()
+        requests.append(request)
+
+    def view(request):
+        return HttpResponse(status=200)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_logger = configure_logger(
+            'bench.legacy', logging.FileHandler(os.path.join(tmp, 'legacy.log'))
+        )
+        queue_handler = QueueFileHandler(os.path.join(tmp, 'api.log'))
+        middleware_module.logger = configure_logger('bench.queue', queue_handler)
+
+        results = [('anterior (FileHandler)', measure(LegacyLoggingMiddleware(view, legacy_logger), requests))]
+        results.append(('cola + JSON lines', measure(middleware_module.LoggingMiddleware(view), requests)))
+        with override_settings(LOGGING_SAMPLE_RATES={'/api/elements/': 0.1}):
+            sampled = middleware_module.LoggingMiddleware(view)
+        results.append(('cola + muestreo 10 %', measure(sampled, requests)))
+
+        drain_start = time.perf_counter()
+        queue_handler.close()
+        drain = time.perf_counter() - drain_start
+        legacy_logger.handlers[0].close()
+
+    print(f"Peticiones: {args.requests}, latencia de disco simulada: {args.disk_latency_us} µs")
+    for name, per_request in results:
+        print(f"{name:<24} {per_request:8.2f} µs/petición")
+    print(f"Vaciado de la cola al cerrar: {drain * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Coste de la instrumentación de métricas.
+
+Mide el tiempo de ``Histogram.observe``, de ``metrics.stage`` y los µs por
+petición que añade ``MetricsMiddleware`` sobre una vista trivial.
+
+Uso:
+    python benchmarks/bench_metrics.py [--iterations 200000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._django import setup_django  # noqa: E402
+
+
+def per_call(function, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=200000)
+    args = parser.parse_args()
+
+    # No usa la base de datos: no necesita PostgreSQL
+    setup_django('benchmarks.settings_sqlite')
+    from django.http import HttpResponse
+    from django.test import RequestFactory
+
+    from api import metrics
+    from api.middleware import MetricsMiddleware
+
+    histogram = metrics.Histogram('bench_seconds', 'Benchmark.', ('stage',))
+
+    def stage():
+        with metrics.stage('bench'):
+            pass
+
+    request = RequestFactory().get('/api/elements/')
+    request.resolver_match = None
+    response = HttpResponse()
+    view = lambda request: response
+    middleware = MetricsMiddleware(view)
+
+    observe = per_call(lambda: histogram.observe(0.003, stage='bench'), args.iterations)
+    timed = per_call(stage, args.iterations)
+    bare = per_call(lambda: view(request), args.iterations)
+    instrumented = per_call(lambda: middleware(request), args.iterations)
+
+    print(f"Histogram.observe           {observe * 1e9:8.0f} ns")
+    print(f"metrics.stage (with)        {timed * 1e9:8.0f} ns")
+    print(f"MetricsMiddleware           {(instrumented - bare) * 1e6:8.2f} µs/petición")
+
+    start = time.perf_counter()
+    metrics.registry.render()
+    print(f"Render de /metrics          {(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Parseo de las filas de ``data``: int() por elemento frente a ``processing.parse_rows``.
+
+Genera filas de 512 números separados por espacios (el formato de
+``samples/sample-03-json.json``) y mide la ruta original con listas de
+Python, la ruta rápida (``np.fromstring``) y la ruta de respaldo con un
+elemento que la ruta rápida no acepta (``1_000``).
+
+Uso:
+    python benchmarks/bench_parse_rows.py [--repeat 3] [--max-value 4095]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import processing  # noqa: E402
+
+SIZES = (10**3, 10**5, 10**6, 10**7)
+
+
+def parse_with_lists(rows):
+    """Implementación original: int() por elemento y una lista plana"""
+    flat = []
+    for row in rows:
+        flat.extend(int(num) for num in row.split())
+    return flat
+
+
+def build_rows(size, max_value, row_length=512):
+    values = np.random.default_rng(0).integers(0, max_value + 1, size=size)
+    return [
+        ' '.join(map(str, row))
+        for row in np.array_split(values, max(1, size // row_length))
+    ]
+
+
+def best_of(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-value', type=int, default=4095)
+    args = parser.parse_args()
+
+    print(f"{'muestras':>10} {'listas (ms)':>12} {'rápida (ms)':>12} {'respaldo (ms)':>14} {'speedup':>8}")
+    for size in SIZES:
+        rows = build_rows(size, args.max_value)
+        fallback_rows = rows[:-1] + [rows[-1] + ' 1_000']
+        assert processing.parse_rows(rows).tolist() == parse_with_lists(rows)
+
+        t_list = best_of(lambda: parse_with_lists(rows), args.repeat)
+        t_fast = best_of(lambda: processing.parse_rows(rows), args.repeat)
+        t_fallback = best_of(lambda: processing.parse_rows(fallback_rows), args.repeat)
+        print(
+            f"{size:>10} {t_list * 1000:>12.1f} {t_fast * 1000:>12.1f} "
+            f"{t_fallback * 1000:>14.1f} {t_list / t_fast:>7.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
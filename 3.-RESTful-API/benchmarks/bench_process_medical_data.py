@@ -0,0 +1,66 @@
+"""
+Micro-benchmark de ``process_medical_data``: implementación con listas frente al motor NumPy.
+
+El motor NumPy (``processing.describe``) calcula además mínimo, máximo,
+desviación estándar y percentiles en la misma pasada.
+
+Uso:
+    python benchmarks/bench_process_medical_data.py [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import processing  # noqa: E402
+
+SIZES = (10**3, 10**5, 10**7)
+
+
+def process_with_lists(flat_data):
+    """Implementación original basada en listas de Python"""
+    max_value = max(flat_data)
+    normalized_data = [x / max_value for x in flat_data]
+
+    avg_before = sum(flat_data) / len(flat_data)
+    avg_after = sum(normalized_data) / len(normalized_data)
+
+    return {
+        'average_before_normalization': avg_before,
+        'average_after_normalization': avg_after,
+        'data_size': len(flat_data)
+    }
+
+
+def best_of(func, repeat):
+    """Devuelve el mejor tiempo (en segundos) de ``repeat`` ejecuciones"""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'muestras':>10} {'listas (ms)':>12} {'numpy (ms)':>12} {'speedup':>8}")
+    for size in SIZES:
+        samples = rng.integers(0, 4096, size=size, dtype=processing.SAMPLE_DTYPE)
+        as_list = samples.tolist()
+
+        expected = process_with_lists(as_list)
+        result = processing.describe(samples)
+        for key, value in expected.items():
+            assert np.isclose(result[key], value), (key, result[key], value)
+
+        t_list = best_of(lambda: process_with_lists(as_list), args.repeat)
+        t_numpy = best_of(lambda: processing.describe(samples), args.repeat)
+        print(f"{size:>10} {t_list * 1000:>12.3f} {t_numpy * 1000:>12.3f} {t_list / t_numpy:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+"""
+Configuración para ejecutar los benchmarks sin PostgreSQL.
+
+Uso:
+    DJANGO_SETTINGS_MODULE=benchmarks.settings_sqlite python benchmarks/<benchmark>.py
+
+Variables de entorno opcionales:
+    BENCHMARK_SQLITE_PATH  ruta del archivo SQLite (por defecto benchmark.sqlite3)
+    BENCHMARK_NO_CACHE     si está definida, desactiva la caché de respuestas
+"""
+import os
+
+from medical_api.settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('BENCHMARK_SQLITE_PATH', BASE_DIR / 'benchmark.sqlite3'),  # noqa: F405
+    }
+}
+
+if os.environ.get('BENCHMARK_NO_CACHE'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
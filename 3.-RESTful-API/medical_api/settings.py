@@ -38,6 +38,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'api.middleware.LoggingMiddleware',  # Movido después de AuthenticationMiddleware
+    'api.middleware.MetricsMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -121,17 +122,55 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Caché compartida para las respuestas de lectura de /elements/. Las
+# invalidaciones cambian claves de generación guardadas en la propia caché, así
+# que todos los procesos (workers de gunicorn, pool de ``reprocess``) deben
+# usar el mismo backend: una caché por proceso (LocMemCache) solo serviría con
+# un único proceso. En producción puede cambiarse por Redis o la caché en base de datos.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    }
+}
+
+# Máximo de nombres de dispositivo en la caché LRU local (nombre -> id)
+DEVICE_CACHE_SIZE = 256
+
 REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
 }
 
+# Número de elementos procesados y confirmados por bloque en la ingesta por streaming
+INGEST_CHUNK_SIZE = 500
+
+# Tamaño máximo (caracteres) de un elemento en la ingesta por streaming
+INGEST_MAX_ELEMENT_SIZE = 64 * 1024 * 1024
+
+# Guarda las muestras originales de cada resultado como .npy direccionado por contenido
+STORE_RAW_DATA = False
+RAW_DATA_ROOT = BASE_DIR / 'raw_data'
+
+# Segundos que se cachean las respuestas de /elements/stats/
+STATS_CACHE_SECONDS = 60
+
+# Número de hilos del pool local que procesa los trabajos de ingesta asíncrona
+INGEST_WORKERS = 2
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'handlers': {
         'file': {
+            # Escritura en un hilo de fondo, en formato JSON lines. Varios procesos escriben
+            # en el mismo archivo, así que la rotación se deja a logrotate (ver README);
+            # 'maxBytes' activa la rotación por tamaño, válida solo con un único proceso
             'level': 'DEBUG',
-            'class': 'logging.FileHandler',
+            'class': 'api.logging_utils.QueueFileHandler',
             'filename': 'api.log',
         },
     },
@@ -142,4 +181,7 @@ LOGGING = {
             'propagate': True,
         },
     },
-}
\ No newline at end of file
+}
+
+# Fracción de peticiones registradas por prefijo de ruta (las respuestas con error se registran siempre)
+LOGGING_SAMPLE_RATES = {}
\ No newline at end of file